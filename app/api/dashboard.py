@@ -1,14 +1,18 @@
 """Dashboard API endpoints."""
 
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 
 import app.core.dependencies as dependencies
 from app.core.config import config
 from app.core.dependencies import get_dashboard_plan_detail_cache, get_dashboard_plans_cache, get_dashboard_stats_cache
 from app.models.responses import DashboardPlanDetail, DashboardPlansResponse, DashboardRunsResponse
+from app.models.testrail import PlanPayload
 from app.services.cache import cache_meta
 from app.services.testrail_client import testrail_service
 
@@ -27,6 +31,47 @@ def _resolve_testrail_client(request: Request):
     return dependencies.get_testrail_client()
 
 
+@dataclass
+class _EmptyRunStats:
+    """Zeroed run statistics used when app.dashboard_stats cannot be imported."""
+
+    run_id: int
+    run_name: str
+    suite_name: str | None = None
+    is_completed: bool = False
+    total_tests: int = 0
+    status_distribution: Dict[str, int] = field(default_factory=dict)
+    pass_rate: float = 0.0
+    completion_rate: float = 0.0
+    updated_on: int | None = None
+
+
+def _run_stats_dict(run_stats: Any) -> Dict[str, Any]:
+    """Convert a run statistics dataclass instance to a response dict."""
+    if is_dataclass(run_stats) and not isinstance(run_stats, type):
+        return asdict(run_stats)
+    raise TypeError(f"Expected run statistics dataclass, got {type(run_stats).__name__}")
+
+
+def _parse_plan_payload(plan_id: int, plan_data: Any) -> PlanPayload:
+    """Validate a get_plan response in one pass, skipping malformed entries and runs."""
+    try:
+        return PlanPayload.model_validate(plan_data)
+    except ValidationError:
+        print(f"Error: Invalid plan data type for {plan_id}: {type(plan_data)}", flush=True)
+        raise HTTPException(status_code=500, detail="Invalid response from TestRail API")
+
+
+def _validated_payload(model: type[BaseModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a freshly built payload once and reduce it to JSON-native types for caching.
+
+    Responses are then returned as ORJSONResponse, so neither hits nor misses go through
+    FastAPI's response_model validation and jsonable_encoder again; response_model stays
+    on the routes for the OpenAPI schema.
+    """
+    return model.model_validate(data).model_dump(mode="json")
+
+
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
@@ -83,7 +128,7 @@ def get_dashboard_plans(
         estimated_flag = data.pop("_estimated_total", False)
         data["meta"] = cache_meta(True, expires_at)
         data["meta"]["estimated_total"] = estimated_flag
-        return data
+        return ORJSONResponse(data)
 
     try:
         base_client = client or testrail_service.get_client()
@@ -282,23 +327,26 @@ def get_dashboard_plans(
         has_more = (len(collected) > limit) or (not source_exhausted)
         estimated_total = not source_exhausted or len(collected) > limit
 
-        response_data = {
-            "plans": plans_with_stats,
-            "total_count": total_count,
-            "offset": offset,
-            "limit": limit,
-            "has_more": has_more,
-            "meta": {},
-            "_estimated_total": estimated_total,
-        }
+        response_data = _validated_payload(
+            DashboardPlansResponse,
+            {
+                "plans": plans_with_stats,
+                "total_count": total_count,
+                "offset": offset,
+                "limit": limit,
+                "has_more": has_more,
+                "meta": {},
+            },
+        )
+        response_data["_estimated_total"] = estimated_total
 
         # Cache the response
         expires_at = plans_cache.set(cache_key, response_data, ttl_seconds=config.DASHBOARD_PLANS_CACHE_TTL)
         meta_dict = cache_meta(False, expires_at)
         meta_dict["estimated_total"] = estimated_total
-        response_data["meta"] = meta_dict
-
-        return response_data
+        data = {**response_data, "meta": meta_dict}
+        del data["_estimated_total"]
+        return ORJSONResponse(data)
 
     except HTTPException:
         raise
@@ -325,9 +373,7 @@ def get_dashboard_plan_detail(
     cached = plan_detail_cache.get(cache_key)
     if cached:
         payload, expires_at = cached
-        data = payload.copy()
-        data["meta"] = cache_meta(True, expires_at)
-        return data
+        return ORJSONResponse({**payload, "meta": cache_meta(True, expires_at)})
 
     try:
         base_client = client or testrail_service.get_client()
@@ -336,7 +382,7 @@ def get_dashboard_plan_detail(
         try:
             from app.dashboard_stats import (
                 calculate_plan_statistics,
-                calculate_run_statistics,
+                calculate_run_statistics_bulk,
             )
         except ImportError:
             # Fallback if dashboard_stats module not available
@@ -359,20 +405,8 @@ def get_dashboard_plan_detail(
 
                 return MockStats(plan_id)
 
-            def calculate_run_statistics(run_id: int, client: Any) -> Any:
-                class MockRunStats:
-                    def __init__(self, run_id: int):
-                        self.run_id = run_id
-                        self.run_name = f"Run {run_id}"
-                        self.suite_name = None
-                        self.is_completed = False
-                        self.total_tests = 0
-                        self.status_distribution: Dict[str, int] = {}
-                        self.pass_rate = 0.0
-                        self.completion_rate = 0.0
-                        self.updated_on = None
-
-                return MockRunStats(run_id)
+            def calculate_run_statistics_bulk(run_ids: list[int], client: Any) -> Dict[int, Any]:
+                return {run_id: _EmptyRunStats(run_id, f"Run {run_id}") for run_id in run_ids}
 
         try:
             plan_stats = calculate_plan_statistics(plan_id, base_client)
@@ -404,47 +438,29 @@ def get_dashboard_plan_detail(
             print(f"Error: Failed to fetch plan data for {plan_id}: {e}", flush=True)
             raise HTTPException(status_code=502, detail=f"Error fetching plan data from TestRail API: {str(e)}")
 
-        # Validate plan data
-        if not isinstance(plan_data, dict):
-            print(f"Error: Invalid plan data type for {plan_id}: {type(plan_data)}", flush=True)
-            raise HTTPException(status_code=500, detail="Invalid response from TestRail API")
-
+        plan_payload = _parse_plan_payload(plan_id, plan_data)
         run_ids: list[int] = []
         run_meta_map: dict[int, dict[str, Any]] = {}
-        entries = plan_data.get("entries", [])
-        if not isinstance(entries, list):
-            print(f"Warning: Invalid entries type for plan {plan_id}: {type(entries)}", flush=True)
-            entries = []
-
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            suite_name = entry.get("name")
-            runs = entry.get("runs", [])
-            if not isinstance(runs, list):
+        for entry, run in plan_payload.runs():
+            run_id = run.id
+            if run_id is None:
                 continue
-            for run in runs:
-                if not isinstance(run, dict):
-                    continue
-                run_id = run.get("id")
-                if run_id:
-                    try:
-                        run_id_int = int(run_id)
-                    except (TypeError, ValueError):
-                        continue
-                    run_ids.append(run_id_int)
-                    run_meta_map[run_id_int] = {
-                        "run_name": run.get("name"),
-                        "suite_name": run.get("suite_name") or suite_name,
-                        "is_completed": run.get("is_completed"),
-                        "updated_on": run.get("updated_on"),
-                    }
-
-        # Calculate statistics for each run
+            run_ids.append(run_id)
+            run_meta_map[run_id] = {
+                "run_name": run.name,
+                "suite_name": run.suite_name or entry.name,
+                "is_completed": run.is_completed,
+                "updated_on": run.updated_on,
+            }
+
+        # Calculate statistics for all runs, fetching them concurrently
+        stats_by_run = calculate_run_statistics_bulk(run_ids, base_client)
         runs_with_stats = []
         for run_id in run_ids:
             try:
-                run_stats = calculate_run_statistics(run_id, base_client)
+                run_stats = stats_by_run[run_id]
+                if isinstance(run_stats, Exception):
+                    raise run_stats
 
                 # Convert to dict format
                 meta = run_meta_map.get(run_id, {})
@@ -456,32 +472,29 @@ def get_dashboard_plan_detail(
                 updated_on = meta.get("updated_on")
                 if updated_on is None:
                     updated_on = run_stats.updated_on
-                run_dict = {
-                    "run_id": run_stats.run_id,
-                    "run_name": run_name,
-                    "suite_name": suite_name,
-                    "is_completed": is_completed,
-                    "total_tests": run_stats.total_tests,
-                    "status_distribution": run_stats.status_distribution,
-                    "pass_rate": run_stats.pass_rate,
-                    "completion_rate": run_stats.completion_rate,
-                    "updated_on": updated_on,
-                }
+                run_dict = _run_stats_dict(run_stats)
+                run_dict.update(
+                    run_name=run_name,
+                    suite_name=suite_name,
+                    is_completed=is_completed,
+                    updated_on=updated_on,
+                )
                 runs_with_stats.append(run_dict)
             except Exception as e:
                 print(f"Warning: Failed to calculate stats for run {run_id}: {e}", flush=True)
 
-        response_data = {
-            "plan": plan_dict,
-            "runs": runs_with_stats,
-            "meta": {},
-        }
+        response_data = _validated_payload(
+            DashboardPlanDetail,
+            {
+                "plan": plan_dict,
+                "runs": runs_with_stats,
+                "meta": {},
+            },
+        )
 
         # Cache the response
         expires_at = plan_detail_cache.set(cache_key, response_data, ttl_seconds=config.DASHBOARD_PLAN_DETAIL_CACHE_TTL)
-        response_data["meta"] = cache_meta(False, expires_at)
-
-        return response_data
+        return ORJSONResponse({**response_data, "meta": cache_meta(False, expires_at)})
 
     except HTTPException:
         raise
@@ -508,9 +521,7 @@ def get_dashboard_runs(
     cached = stats_cache.get(cache_key)
     if cached:
         payload, expires_at = cached
-        data = payload.copy()
-        data["meta"] = cache_meta(True, expires_at)
-        return data
+        return ORJSONResponse({**payload, "meta": cache_meta(True, expires_at)})
 
     try:
         base_client = client or testrail_service.get_client()
@@ -522,82 +533,36 @@ def get_dashboard_runs(
             print(f"Error: Failed to fetch plan data for {plan_id}: {e}", flush=True)
             raise HTTPException(status_code=502, detail=f"Error fetching plan data from TestRail API: {str(e)}")
 
-        # Validate plan data
-        if not isinstance(plan_data, dict):
-            print(f"Error: Invalid plan data type for {plan_id}: {type(plan_data)}", flush=True)
-            raise HTTPException(status_code=500, detail="Invalid response from TestRail API")
-
-        run_ids = []
-        entries = plan_data.get("entries", [])
-        if not isinstance(entries, list):
-            print(f"Warning: Invalid entries type for plan {plan_id}: {type(entries)}", flush=True)
-            entries = []
+        run_ids = _parse_plan_payload(plan_id, plan_data).run_ids()
 
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            runs = entry.get("runs", [])
-            if not isinstance(runs, list):
-                continue
-            for run in runs:
-                if not isinstance(run, dict):
-                    continue
-                run_id = run.get("id")
-                if run_id:
-                    run_ids.append(run_id)
-
-        # Calculate statistics for each run
+        # Calculate statistics for all runs, fetching them concurrently
         try:
-            from app.dashboard_stats import calculate_run_statistics
+            from app.dashboard_stats import calculate_run_statistics_bulk
         except ImportError:
             # Fallback if dashboard_stats module not available
-            def calculate_run_statistics(run_id: int, client: Any) -> Any:
-                class MockRunStats:
-                    def __init__(self, run_id: int):
-                        self.run_id = run_id
-                        self.run_name = f"Run {run_id}"
-                        self.suite_name = None
-                        self.is_completed = False
-                        self.total_tests = 0
-                        self.status_distribution: Dict[str, int] = {}
-                        self.pass_rate = 0.0
-                        self.completion_rate = 0.0
-                        self.updated_on = None
-
-                return MockRunStats(run_id)
-
-        runs_with_stats = []
-        for run_id in run_ids:
-            try:
-                run_stats = calculate_run_statistics(run_id, base_client)
-
-                # Convert to dict format
-                run_dict = {
-                    "run_id": run_stats.run_id,
-                    "run_name": run_stats.run_name,
-                    "suite_name": run_stats.suite_name,
-                    "is_completed": run_stats.is_completed,
-                    "total_tests": run_stats.total_tests,
-                    "status_distribution": run_stats.status_distribution,
-                    "pass_rate": run_stats.pass_rate,
-                    "completion_rate": run_stats.completion_rate,
-                    "updated_on": run_stats.updated_on,
-                }
-                runs_with_stats.append(run_dict)
-            except Exception as e:
-                print(f"Warning: Failed to calculate stats for run {run_id}: {e}", flush=True)
-
-        response_data = {
-            "plan_id": plan_id,
-            "runs": runs_with_stats,
-            "meta": {},
-        }
+            def calculate_run_statistics_bulk(run_ids: list[int], client: Any) -> Dict[int, Any]:
+                return {run_id: _EmptyRunStats(run_id, f"Run {run_id}") for run_id in run_ids}
+
+        stats_by_run = calculate_run_statistics_bulk(run_ids, base_client)
+        for run_id, run_stats in stats_by_run.items():
+            if isinstance(run_stats, Exception):
+                print(f"Warning: Failed to calculate stats for run {run_id}: {run_stats}", flush=True)
+        runs_with_stats = [
+            _run_stats_dict(run_stats) for run_stats in stats_by_run.values() if not isinstance(run_stats, Exception)
+        ]
+
+        response_data = _validated_payload(
+            DashboardRunsResponse,
+            {
+                "plan_id": plan_id,
+                "runs": runs_with_stats,
+                "meta": {},
+            },
+        )
 
         # Cache the response
         expires_at = stats_cache.set(cache_key, response_data, ttl_seconds=config.DASHBOARD_RUN_STATS_CACHE_TTL)
-        response_data["meta"] = cache_meta(False, expires_at)
-
-        return response_data
+        return ORJSONResponse({**response_data, "meta": cache_meta(False, expires_at)})
 
     except HTTPException:
         raise
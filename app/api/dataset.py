@@ -81,8 +81,12 @@ def _get_geometry_type_id(geom_type: str) -> int:
     return geom_id
 
 
-async def _generate_dataset_task(job_id: str, config: DatasetConfig):
-    """Background task to generate dataset."""
+def _generate_dataset_task(job_id: str, config: DatasetConfig):
+    """Background task to generate dataset.
+
+    Deliberately synchronous: BackgroundTasks runs plain functions in the threadpool, so the
+    CPU- and disk-heavy generation no longer blocks the event loop for other requests.
+    """
     job = _jobs[job_id]
     job.status = "running"
 
@@ -274,22 +278,25 @@ async def get_available_labels():
     }
 
 
-@router.delete("/jobs/{job_id}")
-async def delete_job(job_id: str):
-    """Delete a dataset generation job."""
-    if job_id not in _jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    job = _jobs[job_id]
-
-    # Clean up generated files
-    for file_path in job.file_paths:
+def _remove_job_files(file_paths: List[str]):
+    """Delete a job's generated files; failures are ignored since the job record is already gone."""
+    for file_path in file_paths:
         try:
             Path(file_path).unlink(missing_ok=True)
         except Exception:
             pass
 
-    del _jobs[job_id]
+
+@router.delete("/jobs/{job_id}")
+async def delete_job(job_id: str, background_tasks: BackgroundTasks):
+    """Delete a dataset generation job."""
+    job = _jobs.pop(job_id, None)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # Clean up generated files after the response is sent
+    if job.file_paths:
+        background_tasks.add_task(_remove_job_files, list(job.file_paths))
 
     return {"message": f"Job {job_id} deleted successfully"}
 
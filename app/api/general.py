@@ -2,14 +2,17 @@
 
 import json
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
 
+import orjson
 import requests
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
 import app.core.dependencies as dependencies
-from app.services.cache import cache_meta
+from app.services.cache import cache_meta, weak_etag
 from testrail_client import get_plan, get_plans_for_project
-from testrail_daily_report import env_or_die
 
 router = APIRouter(prefix="/api", tags=["general"])
 
@@ -21,11 +24,12 @@ def _resolve_dependency(request: Request, dependency):
     return dependency()
 
 
-def _resolve_plans_cache(request: Request):
+# Cache lookups never block, so these resolve on the event loop instead of in the threadpool.
+async def _resolve_plans_cache(request: Request):
     return _resolve_dependency(request, dependencies.get_plans_cache)
 
 
-def _resolve_runs_cache(request: Request):
+async def _resolve_runs_cache(request: Request):
     return _resolve_dependency(request, dependencies.get_runs_cache)
 
 
@@ -33,6 +37,83 @@ def _resolve_testrail_client(request: Request):
     return _resolve_dependency(request, dependencies.get_testrail_client)
 
 
+# Browsers may keep these payloads but must revalidate them; the ETag turns unchanged polls into 304s.
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def _apply_etag(request: Request, response: Response, etag: str) -> Response | None:
+    """Return a 304 if the client already holds ``etag``; otherwise tag the outgoing response."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+    return None
+
+
+PLAN_FIELDS = ("id", "name", "is_completed", "created_on")
+_plan_fields = itemgetter(*PLAN_FIELDS)
+
+
+def _plan_row(plan: dict) -> tuple:
+    """Pull the slim plan fields in one C-level call, falling back to .get() when a key is missing."""
+    try:
+        return _plan_fields(plan)
+    except KeyError:
+        return tuple(plan.get(name) for name in PLAN_FIELDS)
+
+
+def _serialize_payload(payload: dict, etag_source) -> tuple[bytes, str]:
+    """Pre-serialize a cached payload as ``(body_prefix, etag)``.
+
+    The prefix is the JSON object without its closing brace, so hits only append the meta.
+    """
+    return orjson.dumps(payload)[:-1], weak_etag(etag_source)
+
+
+# Loaders run on a worker thread via TTLCache.get_or_compute; sessions are per-thread, so each
+# resolves its own there. The cached entry carries its ETag so hits can answer 304s directly.
+def _load_plans_payload(project: int, is_completed: int | None) -> tuple[bytes, str]:
+    base_url = dependencies.get_testrail_credentials().base_url
+    session = dependencies.get_testrail_session()
+    plans = get_plans_for_project(session, base_url, project_id=project, is_completed=is_completed)
+    # return concise info
+    rows = [_plan_row(p) for p in plans]
+    slim = [dict(zip(PLAN_FIELDS, row)) for row in rows]
+    return _serialize_payload({"count": len(slim), "plans": slim}, rows)
+
+
+def _load_runs_payload(plan_id: int) -> tuple[bytes, str]:
+    base_url = dependencies.get_testrail_credentials().base_url
+    plan_obj = get_plan(dependencies.get_testrail_session(), base_url, plan_id)
+    runs = [
+        {
+            "id": rid,
+            "name": r.get("name") or f"Run {rid}",
+            "is_completed": bool(r.get("is_completed")),
+            "suite_name": entry.get("name"),
+        }
+        for entry in plan_obj.get("entries", ())
+        for r in entry.get("runs", ())
+        if (rid := r.get("id")) is not None
+    ]
+    runs.sort(key=itemgetter("is_completed", "name"))
+    return _serialize_payload({"count": len(runs), "runs": runs}, [tuple(r.values()) for r in runs])
+
+
+def _cached_response(request: Request, response: Response, cached: tuple, hit: bool, refreshing: bool = False):
+    """Turn a ``((body_prefix, etag), expires_at)`` cache entry into a 304 or a JSON body with cache metadata.
+
+    The plan/run list was serialized once when it was loaded; each response only encodes the
+    small meta object and splices it onto the cached bytes.
+    """
+    (body_prefix, etag), expires_at = cached
+    not_modified = _apply_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    body = b"".join((body_prefix, b',"meta":', orjson.dumps(cache_meta(hit, expires_at, refreshing)), b"}"))
+    return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
 # Default status mapping for test cases
 DEFAULT_STATUS_MAP = {
     1: "Passed",
@@ -44,49 +125,42 @@ DEFAULT_STATUS_MAP = {
 
 
 @router.get("/plans")
-def get_plans(project: int = 1, is_completed: int | None = None, plans_cache=Depends(_resolve_plans_cache)):
-    """List plans for a project, optionally filter by completion (0 or 1)."""
+async def get_plans(
+    request: Request,
+    response: Response,
+    project: int = 1,
+    is_completed: int | None = None,
+    plans_cache=Depends(_resolve_plans_cache),
+):
+    """List plans for a project, optionally filter by completion (0 or 1).
+
+    Responses carry a weak ETag derived from the plan list; pollers sending it back via
+    If-None-Match get an empty 304 while the cached list is unchanged.
+    """
     cache_key = ("plans", project, is_completed)
+    loader = partial(_load_plans_payload, project, is_completed)
     cached = plans_cache.get(cache_key)
     if cached:
-        payload, expires_at = cached
-        data = payload.copy()
-        data["meta"] = cache_meta(True, expires_at)
-        return data
+        refreshing = plans_cache.refresh_ahead(cache_key, loader)
+        return _cached_response(request, response, cached, hit=True, refreshing=refreshing)
 
-    try:
-        base_url = env_or_die("TESTRAIL_BASE_URL").rstrip("/")
-        user = env_or_die("TESTRAIL_USER")
-        api_key = env_or_die("TESTRAIL_API_KEY")
-    except SystemExit:
-        raise HTTPException(status_code=500, detail="Server missing TestRail credentials")
-
-    import requests
-
-    session = requests.Session()
-    session.auth = (user, api_key)
-    plans = get_plans_for_project(session, base_url, project_id=project, is_completed=is_completed)
-
-    # return concise info
-    slim = [
-        {
-            "id": p.get("id"),
-            "name": p.get("name"),
-            "is_completed": p.get("is_completed"),
-            "created_on": p.get("created_on"),
-        }
-        for p in plans
-    ]
-    base_payload = {"count": len(slim), "plans": slim}
-    expires_at = plans_cache.set(cache_key, base_payload)
-    resp = base_payload.copy()
-    resp["meta"] = cache_meta(False, expires_at)
-    return resp
+    # Concurrent misses for the same key share a single TestRail fetch.
+    cached = await run_in_threadpool(plans_cache.get_or_compute, cache_key, loader)
+    return _cached_response(request, response, cached, hit=False)
 
 
 @router.get("/runs")
-def get_runs(plan: int | None = None, project: int = 1, runs_cache=Depends(_resolve_runs_cache)):
-    """Return runs for a plan. If no plan is provided, return an empty list instead of 422."""
+async def get_runs(
+    request: Request,
+    response: Response,
+    plan: int | None = None,
+    project: int = 1,
+    runs_cache=Depends(_resolve_runs_cache),
+):
+    """Return runs for a plan. If no plan is provided, return an empty list instead of 422.
+
+    Like ``/api/plans``, responses carry a weak ETag so unchanged polls get an empty 304.
+    """
     # Gracefully handle missing plan so client-side refreshes don't 422
     if plan is None:
         return {
@@ -104,66 +178,25 @@ def get_runs(plan: int | None = None, project: int = 1, runs_cache=Depends(_reso
         raise HTTPException(status_code=400, detail="plan must be positive")
 
     cache_key = ("runs", project, plan)
+    loader = partial(_load_runs_payload, plan)
     cached = runs_cache.get(cache_key)
     if cached:
-        payload, expires_at = cached
-        data = payload.copy()
-        data["meta"] = cache_meta(True, expires_at)
-        return data
-
-    try:
-        base_url = env_or_die("TESTRAIL_BASE_URL").rstrip("/")
-        user = env_or_die("TESTRAIL_USER")
-        api_key = env_or_die("TESTRAIL_API_KEY")
-    except SystemExit:
-        raise HTTPException(status_code=500, detail="Server missing TestRail credentials")
+        refreshing = runs_cache.refresh_ahead(cache_key, loader)
+        return _cached_response(request, response, cached, hit=True, refreshing=refreshing)
 
-    import requests
-
-    session = requests.Session()
-    session.auth = (user, api_key)
     try:
-        plan_obj = get_plan(session, base_url, plan)
+        cached = await run_in_threadpool(runs_cache.get_or_compute, cache_key, loader)
     except requests.exceptions.RequestException as e:
         raise HTTPException(status_code=502, detail=f"Error fetching plan runs: {e}")
-
-    runs = []
-    for entry in plan_obj.get("entries", []):
-        suite_name = entry.get("name")
-        for r in entry.get("runs", []):
-            rid = r.get("id")
-            if rid is None:
-                continue
-            runs.append(
-                {
-                    "id": rid,
-                    "name": r.get("name") or f"Run {rid}",
-                    "is_completed": r.get("is_completed"),
-                    "suite_name": suite_name,
-                }
-            )
-    runs.sort(key=lambda item: (item.get("is_completed", 0), item.get("name", "")))
-    base_payload = {"count": len(runs), "runs": runs}
-    expires_at = runs_cache.set(cache_key, base_payload)
-    data = base_payload.copy()
-    data["meta"] = cache_meta(False, expires_at)
-    return data
+    return _cached_response(request, response, cached, hit=False)
 
 
 @router.get("/run/{run_id}")
 def get_run(run_id: int, client=Depends(_resolve_testrail_client)):
     """Fetch details for a specific run."""
-    try:
-        base_url = env_or_die("TESTRAIL_BASE_URL").rstrip("/")
-        user = env_or_die("TESTRAIL_USER")
-        api_key = env_or_die("TESTRAIL_API_KEY")
-    except SystemExit:
-        raise HTTPException(status_code=500, detail="Server missing TestRail credentials")
-
-    import requests
-
-    session = requests.Session()
-    session.auth = (user, api_key)
+    credentials = dependencies.get_testrail_credentials()
+    base_url = credentials.base_url
+    session = dependencies.get_testrail_session()
 
     try:
         # Fetch run details from TestRail
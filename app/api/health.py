@@ -28,9 +28,9 @@ def _resolve_testrail_client(request: Request):
     return _resolve_dependency(request, dependencies.get_testrail_client)
 
 
-@router.get("/healthz")
+@router.api_route("/healthz", methods=["GET", "HEAD"])
 def health_check(plans_cache=Depends(_resolve_plans_cache), runs_cache=Depends(_resolve_runs_cache)):
-    """Basic health check endpoint."""
+    """Basic health check endpoint (HEAD is accepted for the keepalive ping)."""
     # Import here to avoid circular imports
     try:
         from app.api.reports import job_manager
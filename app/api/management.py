@@ -3,12 +3,14 @@
 import os
 import tempfile
 import time
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import Any, BinaryIO, Dict, List, cast
 
 import requests
 from fastapi import APIRouter, Body, Depends, File, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, Response
 from PIL import Image
 from starlette.background import BackgroundTask
@@ -29,11 +31,41 @@ def _resolve_testrail_client(request: Request):
     return dependencies.get_testrail_client()
 
 
-def _attachment_download_limit() -> int | None:
+# Copy uploads in bounded chunks so an attachment never has to fit in memory at once.
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Size of an upload, measured by seeking when the multipart parser did not record it."""
+    if file.size is not None:
+        return file.size
+    source = file.file
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return size
+
+
+def _upload_via_tempfile(upload, target_id: int, source: BinaryIO, filename: str) -> Dict[str, Any]:
+    """Spool an upload to a temp file and push it to TestRail; blocking, so run it in the threadpool."""
+    source.seek(0)
+    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=Path(filename).suffix) as tmp:
+        # Chunked copy; shutil.copyfileobj's AnyStr signature defeats mypy's inference here.
+        for chunk in iter(partial(source.read, UPLOAD_CHUNK_SIZE), b""):
+            tmp.write(chunk)
+        tmp_path = tmp.name
     try:
-        limit = int(os.getenv("ATTACHMENT_MAX_BYTES", "0"))
-    except ValueError:
-        limit = 0
+        return upload(target_id, tmp_path, filename)
+    finally:
+        # Clean up temp file
+        try:
+            Path(tmp_path).unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
+def _attachment_download_limit() -> int | None:
+    limit = config.ATTACHMENT_MAX_BYTES
     return limit if limit > 0 else None
 
 
@@ -404,9 +436,8 @@ async def add_case_attachment(
         allowed_types = ", ".join(config.ALLOWED_FILE_TYPES.values())
         raise HTTPException(status_code=400, detail=f"File type not allowed. Accepted types: {allowed_types}")
 
-    # Read file content and validate size
-    content = await file.read()
-    file_size = len(content)
+    # Validate size without reading the upload into memory
+    file_size = _upload_size(file)
 
     if file_size > config.MAX_FILE_SIZE_BYTES:
         raise HTTPException(status_code=400, detail=f"File size exceeds {config.MAX_FILE_SIZE_MB}MB limit")
@@ -415,31 +446,22 @@ async def add_case_attachment(
     filename = file.filename or "attachment"
 
     try:
-        suffix = Path(filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
+        # The TestRail upload is blocking I/O; keep it off the event loop.
+        result = await run_in_threadpool(
+            _upload_via_tempfile, client.add_attachment_to_case, case_id, file.file, filename
+        )
 
-        try:
-            result = client.add_attachment_to_case(case_id, tmp_path, filename)
-
-            # Build response with attachment metadata
-            attachment = {
-                "id": result.get("attachment_id"),
-                "name": filename,
-                "filename": filename,
-                "size": file_size,
-                "content_type": content_type,
-                "created_on": int(time.time()),
-            }
+        # Build response with attachment metadata
+        attachment = {
+            "id": result.get("attachment_id"),
+            "name": filename,
+            "filename": filename,
+            "size": file_size,
+            "content_type": content_type,
+            "created_on": int(time.time()),
+        }
 
-            return {"attachment": attachment}
-        finally:
-            # Clean up temp file
-            try:
-                Path(tmp_path).unlink(missing_ok=True)
-            except Exception:
-                pass
+        return {"attachment": attachment}
 
     except requests.exceptions.HTTPError as e:
         if e.response is not None and e.response.status_code == 404:
@@ -818,7 +840,7 @@ async def add_test_result(
         body["assignedto_id"] = payload.assignedto_id
 
     try:
-        result = client.add_result_for_test(test_id, body)
+        result = await run_in_threadpool(client.add_result_for_test, test_id, body)
         return {"success": True, "result": result}
     except requests.exceptions.HTTPError as e:
         if e.response is not None and e.response.status_code == 404:
@@ -848,9 +870,8 @@ async def add_result_attachment(
         allowed_types = ", ".join(config.ALLOWED_FILE_TYPES.values())
         raise HTTPException(status_code=400, detail=f"File type not allowed. Accepted types: {allowed_types}")
 
-    # Read file content and validate size
-    content = await file.read()
-    file_size = len(content)
+    # Validate size without reading the upload into memory
+    file_size = _upload_size(file)
 
     if file_size > config.MAX_FILE_SIZE_BYTES:
         raise HTTPException(status_code=400, detail=f"File size exceeds {config.MAX_FILE_SIZE_MB}MB limit")
@@ -859,31 +880,22 @@ async def add_result_attachment(
     filename = file.filename or "attachment"
 
     try:
-        suffix = Path(filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
+        # The TestRail upload is blocking I/O; keep it off the event loop.
+        result = await run_in_threadpool(
+            _upload_via_tempfile, client.add_attachment_to_result, result_id, file.file, filename
+        )
 
-        try:
-            result = client.add_attachment_to_result(result_id, tmp_path, filename)
-
-            # Build response with attachment metadata
-            attachment = {
-                "id": result.get("attachment_id"),
-                "name": filename,
-                "filename": filename,
-                "size": file_size,
-                "content_type": content_type,
-                "created_on": int(time.time()),
-            }
+        # Build response with attachment metadata
+        attachment = {
+            "id": result.get("attachment_id"),
+            "name": filename,
+            "filename": filename,
+            "size": file_size,
+            "content_type": content_type,
+            "created_on": int(time.time()),
+        }
 
-            return {"success": True, "attachment": attachment}
-        finally:
-            # Clean up temp file
-            try:
-                Path(tmp_path).unlink(missing_ok=True)
-            except Exception:
-                pass
+        return {"success": True, "attachment": attachment}
 
     except requests.exceptions.HTTPError as e:
         if e.response is not None and e.response.status_code == 404:
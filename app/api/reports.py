@@ -1,5 +1,7 @@
 """Reports API endpoints for report generation."""
 
+import asyncio
+import os
 import threading
 import time
 import uuid
@@ -8,13 +10,13 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 import requests
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 
 from app.core.config import config
-from app.core.dependencies import get_testrail_client
+from app.core.dependencies import get_report_artifact_cache, get_testrail_client
 from app.models.requests import ReportRequest
 from app.utils.helpers import report_worker_config
 from testrail_client import capture_telemetry
@@ -23,6 +25,102 @@ from testrail_daily_report import generate_report
 router = APIRouter(prefix="/api", tags=["reports"])
 
 
+def _artifact_key(
+    project: int, plan: int | None = None, run: int | None = None, run_ids: list[int] | None = None
+) -> tuple:
+    # Run order is part of the key: generate_report renders runs in the order given.
+    return ("report", project, plan, run, tuple(run_ids) if run_ids else ())
+
+
+def report_url(path: str) -> str:
+    """Public URL of a generated report; os.path.basename avoids building a Path per completion."""
+    return "/reports/" + os.path.basename(path)
+
+
+def validate_report_params(
+    project: int, plan: int | None = None, run: int | None = None, run_ids: list[int] | None = None
+):
+    """Reject malformed report parameters before any TestRail I/O or rendering happens."""
+    if project < 1:
+        raise HTTPException(status_code=400, detail="Project ID must be positive")
+    if run_ids and plan is None:
+        raise HTTPException(status_code=400, detail="Run selection requires a plan")
+    if (plan is None) == (run is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of plan or run")
+    if (plan is not None and plan < 1) or (run is not None and run < 1):
+        raise HTTPException(status_code=400, detail="Plan and run IDs must be positive")
+    if run_ids and min(run_ids) < 1:
+        raise HTTPException(status_code=400, detail="Run IDs must be positive")
+
+
+def parse_report_form(
+    project: int, plan_raw: str, run_raw: str, run_ids: list[str] | None = None
+) -> tuple[int | None, int | None, list[int] | None]:
+    """Parse form-encoded plan/run/run_ids (blank means unset) and validate them like the JSON endpoints."""
+    try:
+        plan = int(plan_raw) if plan_raw.strip() else None
+        run = int(run_raw) if run_raw.strip() else None
+        selected_run_ids = [int(x) for x in run_ids] if run_ids else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Plan, run and run IDs must be integers")
+    validate_report_params(project, plan, run, selected_run_ids)
+    return plan, run, selected_run_ids
+
+
+def reusable_report(
+    project: int, plan: int | None = None, run: int | None = None, run_ids: list[int] | None = None
+) -> str | None:
+    """Path of a report generated for the same parameters within REPORT_REUSE_TTL, if it still exists."""
+    if config.REPORT_REUSE_TTL <= 0:
+        return None
+    key = _artifact_key(project, plan, run, run_ids)
+    cache = get_report_artifact_cache()
+    cached = cache.get(key)
+    if cached:
+        path, _ = cached
+        if Path(path).exists():
+            return path
+        # Cleaned up since; drop it so the next generation is not handed the dead path.
+        cache.discard(key)
+    return None
+
+
+def reuse_or_generate(params: Dict[str, Any], generate: Callable[[], Any]) -> tuple[str, bool]:
+    """Return ``(path, reused)`` for report ``params``, calling ``generate`` only when needed.
+
+    A finished artifact within REPORT_REUSE_TTL is reused, and identical requests that arrive
+    while one is generating wait for its result (get_or_compute) instead of generating again.
+    """
+    reusable = reusable_report(**params)
+    if reusable:
+        return reusable, True
+    if config.REPORT_REUSE_TTL <= 0:
+        return str(generate()), False
+    generated_here = False
+
+    def _load() -> str:
+        nonlocal generated_here
+        generated_here = True
+        return str(generate())
+
+    path, _ = get_report_artifact_cache().get_or_compute(_artifact_key(**params), _load)
+    return path, not generated_here
+
+
+def generate_report_cached(
+    project: int, plan: int | None = None, run: int | None = None, run_ids: list[int] | None = None
+) -> str:
+    """Generate a report, reusing an artifact produced for the same parameters within REPORT_REUSE_TTL."""
+    params: Dict[str, Any] = {"project": project, "plan": plan, "run": run, "run_ids": run_ids}
+    path, _ = reuse_or_generate(params, lambda: generate_report(**params))
+    return path
+
+
+# keep only recent few progress entries per job
+PROGRESS_HISTORY = 25
+TERMINAL_STATUSES = frozenset({"success", "error"})
+
+
 @dataclass(slots=True)
 class ReportJob:
     """Report generation job."""
@@ -37,9 +135,17 @@ class ReportJob:
     url: str | None = None
     error: str | None = None
     meta: Dict[str, Any] = field(default_factory=dict)
+    # Most recent progress updates; surfaced as meta["progress_updates"] by to_dict().
+    progress_updates: deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=PROGRESS_HISTORY))
+    # Position in the manager's FIFO; queue position is this minus the number of jobs started.
+    queue_index: int = 0
+    # Serialized form of a finished job; success/error jobs never change, so polls reuse it.
+    _final_dict: Dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self):
-        return {
+        if self._final_dict is not None:
+            return self._final_dict
+        data = {
             "id": self.id,
             "status": self.status,
             "created_at": self.created_at.isoformat(),
@@ -48,9 +154,14 @@ class ReportJob:
             "path": self.path,
             "url": self.url,
             "error": self.error,
-            "meta": self.meta,
+            "meta": {**self.meta, "progress_updates": list(self.progress_updates)}
+            if self.progress_updates
+            else self.meta,
             "params": self.params,
         }
+        if self.status in TERMINAL_STATUSES:
+            self._final_dict = data
+        return data
 
 
 class ReportJobManager:
@@ -60,14 +171,21 @@ class ReportJobManager:
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.jobs: Dict[str, ReportJob] = {}
         self.order: deque[str] = deque()
+        # Guards order/history and the enqueue/start counters; single-job reads need no lock.
         self.lock = threading.Lock()
         self.max_history = max_history
+        self._enqueued = 0
+        self._started = 0
 
     def enqueue(self, params: Dict[str, Any]) -> ReportJob:
         """Enqueue a new report generation job."""
+        # Random, not sequential: GET /api/report/{job_id} is unauthenticated, so an ID must
+        # not reveal the IDs of other users' jobs.
         job_id = uuid.uuid4().hex
-        job = ReportJob(id=job_id, params=params)
         with self.lock:
+            queue_index = self._enqueued
+            self._enqueued += 1
+            job = ReportJob(id=job_id, params=params, queue_index=queue_index)
             self.jobs[job_id] = job
             self.order.append(job_id)
         self.executor.submit(self._run_job, job_id)
@@ -75,28 +193,22 @@ class ReportJobManager:
 
     def get(self, job_id: str) -> ReportJob | None:
         """Get job by ID."""
-        with self.lock:
-            return self.jobs.get(job_id)
+        return self.jobs.get(job_id)
 
     def serialize(self, job: ReportJob) -> Dict[str, Any]:
         """Serialize job to dict with queue position."""
-        data: Dict[str, Any] = job.to_dict()
-        data["queue_position"] = self.queue_position(job.id)
-        return data
+        return {**job.to_dict(), "queue_position": self.queue_position(job.id)}
 
     def queue_position(self, job_id: str) -> int | None:
-        """Get position in queue for queued jobs."""
-        with self.lock:
-            position = 0
-            for jid in self.order:
-                job = self.jobs.get(jid)
-                if not job:
-                    continue
-                if jid == job_id:
-                    return position if job.status == "queued" else None
-                if job.status == "queued":
-                    position += 1
-        return None
+        """Get position in queue for queued jobs.
+
+        The executor starts jobs in FIFO order, so the jobs ahead of a queued one are those
+        enqueued before it minus those already started.
+        """
+        job = self.jobs.get(job_id)
+        if not job or job.status != "queued":
+            return None
+        return max(0, job.queue_index - self._started)
 
     def stats(self) -> Dict[str, Any]:
         """Get job manager statistics."""
@@ -128,39 +240,40 @@ class ReportJobManager:
         }
 
     def _trim_history(self):
-        """Trim job history to max_history limit."""
-        with self.lock:
-            while len(self.order) > self.max_history:
+        """Trim job history to max_history limit.
+
+        The lock is retaken per eviction so a long backlog never blocks enqueue for the whole trim.
+        """
+        while True:
+            with self.lock:
+                if len(self.order) <= self.max_history:
+                    return
                 oldest_id = self.order[0]
                 job = self.jobs.get(oldest_id)
-                if job and job.status not in {"success", "error"}:
-                    break
+                if job and job.status not in TERMINAL_STATUSES:
+                    return
                 self.order.popleft()
                 self.jobs.pop(oldest_id, None)
 
     def report_progress(self, job_id: str, stage: str, payload: Dict | None = None):
-        """Report progress for a job."""
-        with self.lock:
-            job = self.jobs.get(job_id)
-            if not job:
-                return
-            job.meta.setdefault("progress_updates", [])
-            update = {
-                "stage": stage,
-                "payload": payload or {},
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-            job.meta["stage"] = stage
-            job.meta["stage_payload"] = payload or {}
-            job.meta["updated_at"] = update["timestamp"]
-            job.meta["progress_updates"].append(update)
-            # keep only recent few entries
-            if len(job.meta["progress_updates"]) > 25:
-                job.meta["progress_updates"] = job.meta["progress_updates"][-25:]
+        """Report progress for a job.
+
+        Lock-free: deque appends are atomic and meta is swapped for a new dict in one
+        assignment, so pollers always see a consistent stage/payload/timestamp triple.
+        """
+        job = self.jobs.get(job_id)
+        if not job:
+            return
+        payload = payload or {}
+        timestamp = datetime.now(timezone.utc).isoformat()
+        job.progress_updates.append({"stage": stage, "payload": payload, "timestamp": timestamp})
+        job.meta = {**job.meta, "stage": stage, "stage_payload": payload, "updated_at": timestamp}
 
     def _run_job(self, job_id: str):
         """Execute a report generation job."""
         job = self.get(job_id)
+        with self.lock:
+            self._started += 1
         if not job:
             return
         job.status = "running"
@@ -172,19 +285,29 @@ class ReportJobManager:
             def reporter(stage, payload=None):
                 self.report_progress(job_id, stage, payload or {})
 
-            with capture_telemetry() as telemetry:
-                path = generate_report(**job.params, progress=reporter)
+            telemetry = None
+
+            def generate():
+                nonlocal telemetry
+                with capture_telemetry() as telemetry:
+                    return generate_report(**job.params, progress=reporter)
+
+            # Identical jobs running side by side wait on the first one's generation, and
+            # later ones take its artifact, instead of each refetching TestRail.
+            path, reused = reuse_or_generate(job.params, generate)
             duration_ms = (time.perf_counter() - start) * 1000.0
             completed_at = datetime.now(timezone.utc)
             job.completed_at = completed_at
             job.path = str(path)
-            job.url = "/reports/" + Path(path).name
+            job.url = report_url(path)
             api_calls = telemetry.get("api_calls", []) if isinstance(telemetry, dict) else []
+            job.progress_updates.clear()
             job.meta = {
                 "generated_at": completed_at.isoformat(),
                 "duration_ms": round(duration_ms, 2),
                 "api_call_count": len(api_calls),
                 "api_calls": api_calls,
+                "reused": reused,
             }
             job.status = "success"
             print(
@@ -193,8 +316,9 @@ class ReportJobManager:
             )
         except Exception as exc:
             job.error = str(exc)
-            job.status = "error"
             job.completed_at = datetime.now(timezone.utc)
+            # status last: once it is terminal, to_dict() freezes the job's serialized form
+            job.status = "error"
             print(f"[report-job] {job_id} failed: {exc}", flush=True)
         finally:
             self._trim_history()
@@ -206,22 +330,23 @@ job_manager = ReportJobManager(max_workers=report_worker_count, max_history=conf
 
 
 @router.get("/report")
-def report_sync(
+async def report_sync(
     project: int = 1,
     plan: int | None = None,
     run: int | None = None,
     run_ids: list[int] | None = None,
     client=Depends(get_testrail_client),
 ):
-    """Generate report synchronously (legacy endpoint)."""
-    if run_ids and plan is None:
-        raise HTTPException(status_code=400, detail="Run selection requires a plan")
-    if (plan is None and run is None) or (plan is not None and run is not None):
-        raise HTTPException(status_code=400, detail="Provide exactly one of plan or run")
+    """Generate report synchronously (legacy endpoint).
+
+    Generation blocks on TestRail for its whole duration, so it runs in asyncio's default
+    executor rather than holding one of the threadpool slots other sync endpoints need.
+    """
+    validate_report_params(project, plan, run, run_ids)
 
     try:
-        path = generate_report(project=project, plan=plan, run=run, run_ids=run_ids)
-        url = "/reports/" + Path(path).name
+        path = await asyncio.to_thread(generate_report_cached, project=project, plan=plan, run=run, run_ids=run_ids)
+        url = report_url(path)
         return {"path": path, "url": url}
     except requests.exceptions.RequestException as e:
         raise HTTPException(status_code=502, detail=f"Error connecting to TestRail API: {e}")
@@ -239,8 +364,8 @@ def report_async(payload: ReportRequest = Body(...)):
 
 
 @router.get("/report/{job_id}")
-def report_status(job_id: str):
-    """Get status of an async report generation job."""
+async def report_status(job_id: str):
+    """Get status of an async report generation job (in-memory only, so it is served on the event loop)."""
     job = job_manager.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Report job not found")
@@ -248,6 +373,6 @@ def report_status(job_id: str):
 
 
 @router.get("/report/queue/stats")
-def report_queue_stats():
-    """Get report queue statistics."""
+async def report_queue_stats():
+    """Get report queue statistics (in-memory only, so it is served on the event loop)."""
     return job_manager.stats()
@@ -4,10 +4,22 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Ensure local .env overrides host/env settings before importing modules that read env.
 repo_root = Path(__file__).resolve().parents[2]
 dotenv_path = repo_root / ".env"
-if dotenv_path.exists():
-    load_dotenv(dotenv_path=dotenv_path, override=True)
-else:
-    load_dotenv(override=True)
+_env_loaded = False
+
+
+def load_environment() -> None:
+    """Load .env into os.environ once per process; repeat calls are no-ops."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    if dotenv_path.exists():
+        load_dotenv(dotenv_path=dotenv_path, override=True)
+    else:
+        load_dotenv(override=True)
+    _env_loaded = True
+
+
+# Ensure local .env overrides host/env settings before importing modules that read env.
+load_environment()
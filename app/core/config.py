@@ -93,10 +93,17 @@ class Config:
     REPORT_WORKERS = max(1, _int_env("REPORT_WORKERS", 1))
     REPORT_WORKERS_MAX = max(1, _int_env("REPORT_WORKERS_MAX", 4))
     REPORT_JOB_HISTORY = max(10, _int_env("REPORT_JOB_HISTORY", 60))
+    REPORT_REUSE_TTL = _int_env("REPORT_REUSE_TTL", 60)
+    # Raises PerformanceService's streaming threads above max(4, resolved report workers).
+    PERF_IO_WORKERS = _int_env("PERF_IO_WORKERS", 0)
+    # Set to 1 to gc.collect() around PerformanceService.memory_monitor blocks (debugging only).
+    PERF_MEMORY_MONITOR_GC = _int_env("PERF_MEMORY_MONITOR_GC", 0) == 1
 
     # File Upload Configuration
     MAX_FILE_SIZE_MB = 25
     MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+    # Attachment download cap; 0 or less disables the limit.
+    ATTACHMENT_MAX_BYTES = _int_env("ATTACHMENT_MAX_BYTES", 0)
     ALLOWED_FILE_TYPES = {
         "image/png": "PNG",
         "image/jpeg": "JPG",
@@ -109,6 +116,7 @@ class Config:
     }
 
     # Keepalive Configuration
+    KEEPALIVE_URL = os.getenv("KEEPALIVE_URL") or None
     KEEPALIVE_INTERVAL = max(60, _int_env("KEEPALIVE_INTERVAL", 240))
     MEM_LOG_INTERVAL = max(30, _int_env("MEM_LOG_INTERVAL", 60))
 
@@ -1,7 +1,9 @@
 """FastAPI dependency injection setup."""
 
+from dataclasses import dataclass
 from functools import lru_cache
 
+import requests
 from fastapi import HTTPException
 
 from app.core.config import config
@@ -52,15 +54,45 @@ def get_dashboard_run_stats_cache() -> TTLCache:
     return TTLCache(ttl_seconds=config.DASHBOARD_RUN_STATS_CACHE_TTL, maxsize=256)
 
 
-def get_testrail_client() -> TestRailClient:
-    """Get TestRail client instance."""
+@lru_cache()
+def get_report_artifact_cache() -> TTLCache:
+    """Get cache of recently generated report paths keyed by report parameters."""
+    return TTLCache(ttl_seconds=config.REPORT_REUSE_TTL, maxsize=32)
+
+
+@dataclass(frozen=True, slots=True)
+class TestRailCredentials:
+    """TestRail connection settings resolved from the environment."""
+
+    base_url: str
+    user: str
+    api_key: str
+
+    @property
+    def auth(self) -> tuple[str, str]:
+        return (self.user, self.api_key)
+
+
+@lru_cache(maxsize=1)
+def get_testrail_credentials() -> TestRailCredentials:
+    """Resolve TestRail credentials once per process; every TestRail path goes through here.
+
+    Failures are not cached, so a missing variable keeps returning 500 until it is set.
+    The environment of a running process does not change on its own, so rotating keys means
+    a restart, or ``get_testrail_credentials.cache_clear()`` after updating os.environ.
+    """
     try:
         base_url = env_or_die("TESTRAIL_BASE_URL").rstrip("/")
         user = env_or_die("TESTRAIL_USER")
         api_key = env_or_die("TESTRAIL_API_KEY")
     except SystemExit:
         raise HTTPException(status_code=500, detail="Server missing TestRail credentials")
+    return TestRailCredentials(base_url=base_url, user=user, api_key=api_key)
+
 
+@lru_cache(maxsize=4)
+def _build_testrail_client(base_url: str, user: str, api_key: str) -> TestRailClient:
+    """Build one stateless TestRail client per credential set and share it across requests."""
     return TestRailClient(
         base_url=base_url,
         auth=(user, api_key),
@@ -70,6 +102,18 @@ def get_testrail_client() -> TestRailClient:
     )
 
 
+def get_testrail_session() -> requests.Session:
+    """Keep-alive TestRail session for the resolved credentials, one per worker thread."""
+    credentials = get_testrail_credentials()
+    return _build_testrail_client(credentials.base_url, credentials.user, credentials.api_key).thread_session()
+
+
+def get_testrail_client() -> TestRailClient:
+    """Get the shared TestRail client for the current credentials."""
+    credentials = get_testrail_credentials()
+    return _build_testrail_client(credentials.base_url, credentials.user, credentials.api_key)
+
+
 def require_write_enabled():
     """Dependency to check if write operations are enabled."""
     # For now, always allow writes. This can be extended later
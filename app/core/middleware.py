@@ -1,23 +1,38 @@
 """FastAPI middleware configuration."""
 
+import itertools
+import secrets
 import time
-import uuid
 from datetime import datetime, timezone
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+# Correlation IDs only need to be unique per process: a boot nonce plus a counter avoids
+# reading os.urandom for a uuid4 on every request.
+_BOOT_NONCE = secrets.token_hex(4)
+_request_seq = itertools.count(1)
+
+
+# Static part of every 500 body; handlers add timestamp and correlation_id.
+INTERNAL_ERROR_BODY = {"detail": "An unexpected error occurred", "error_code": "INTERNAL_SERVER_ERROR"}
+
+
+def new_correlation_id() -> str:
+    """Return a process-unique correlation ID without touching the OS random source."""
+    return f"{_BOOT_NONCE}-{next(_request_seq):08x}"
+
 
 class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     """Middleware for centralized error handling and logging."""
 
     async def dispatch(self, request: Request, call_next):
         # Generate correlation ID for request tracking
-        correlation_id = str(uuid.uuid4())
+        correlation_id = new_correlation_id()
         request.state.correlation_id = correlation_id
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             response = await call_next(request)
@@ -29,7 +44,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
 
         except Exception as exc:
             # Log the error with context
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             print(
                 f"[ERROR] {correlation_id} - {request.method} {request.url} - "
                 f"{type(exc).__name__}: {str(exc)} - Duration: {duration:.3f}s",
@@ -37,11 +52,10 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             )
 
             # Return structured error response
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
-                    "detail": "An unexpected error occurred",
-                    "error_code": "INTERNAL_SERVER_ERROR",
+                    **INTERNAL_ERROR_BODY,
                     "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                     "correlation_id": correlation_id,
                 },
@@ -53,11 +67,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for request/response logging."""
 
     async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         response = await call_next(request)
 
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         correlation_id = getattr(request.state, "correlation_id", "unknown")
 
         # Log request/response info
@@ -34,13 +34,22 @@ Performance Considerations:
 - Functions make multiple API calls to TestRail
 - Results should be cached at the API endpoint level
 - Large plans with many runs may take several seconds to process
+- Use calculate_run_statistics_bulk to fetch many runs concurrently
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
 from testrail_client import TestRailClient
 
+# Keep concurrent TestRail fetches modest to stay clear of API rate limits
+RUN_STATS_MAX_WORKERS = 4
+
+# Long-lived so each worker keeps its thread-local TestRail session (and its keep-alive
+# connections) across dashboard requests; also caps fetches process-wide, not per call.
+_run_stats_executor = ThreadPoolExecutor(max_workers=RUN_STATS_MAX_WORKERS, thread_name_prefix="run-stats")
+
 
 @dataclass
 class RunStatistics:
@@ -337,6 +346,37 @@ def calculate_run_statistics(run_id: int, client: TestRailClient) -> RunStatisti
     )
 
 
+def calculate_run_statistics_bulk(run_ids: list[int], client: TestRailClient) -> dict[int, RunStatistics | Exception]:
+    """
+    Calculate statistics for several runs, fetching their tests concurrently.
+
+    TestRail has no endpoint returning tests for multiple runs, so each run still
+    needs one request; issuing them in parallel bounds latency by the slowest run
+    rather than the sum of all runs. Requests share a module-level pool of
+    RUN_STATS_MAX_WORKERS threads.
+
+    Args:
+        run_ids: TestRail run IDs (duplicates are fetched once)
+        client: TestRail API client
+
+    Returns:
+        Dictionary mapping each run ID to its RunStatistics, or to the exception
+        raised while calculating it so callers can skip failed runs individually
+    """
+    unique_ids = list(dict.fromkeys(run_ids))
+    if not unique_ids:
+        return {}
+
+    results: dict[int, RunStatistics | Exception] = {}
+    futures = {run_id: _run_stats_executor.submit(calculate_run_statistics, run_id, client) for run_id in unique_ids}
+    for run_id, future in futures.items():
+        try:
+            results[run_id] = future.result()
+        except Exception as e:
+            results[run_id] = e
+    return results
+
+
 def calculate_plan_statistics(plan_id: int, client: TestRailClient) -> PlanStatistics:
     """
     Calculate aggregated statistics across all runs in a plan.
@@ -1,14 +1,22 @@
 """Main FastAPI application with modular architecture."""
 
+# Load .env before any module below reads configuration from the environment.
+from app.core import bootstrap  # noqa: F401
+
+# isort: split
+import asyncio
 import os
-import threading
+import stat
+from functools import lru_cache
 from pathlib import Path
 
+import httpx
 import requests
-from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Form, HTTPException, Request, Response
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from app.api.automation import router as automation_router
 from app.api.dashboard import router as dashboard_router
@@ -16,42 +24,74 @@ from app.api.dataset import router as dataset_router
 from app.api.general import router as general_router
 from app.api.health import router as health_router
 from app.api.management import router as management_router
+from app.api.reports import generate_report_cached, parse_report_form, report_url
 from app.api.reports import router as reports_router
-from app.core import bootstrap  # noqa: F401
+from app.core.config import config
 from app.core.middleware import ErrorHandlingMiddleware, RequestLoggingMiddleware
 from app.utils.helpers import report_worker_config, web_worker_count
-from testrail_daily_report import generate_report, log_memory
+from testrail_daily_report import log_memory
 
-app = FastAPI(title="TestRail Reporter", version="0.1.0")
+# JSON-heavy endpoints (plans, runs, dashboard stats) serialize through orjson's C path.
+app = FastAPI(title="TestRail Reporter", version="0.1.0", default_response_class=ORJSONResponse)
 
 # Add middleware
 app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 
 # Serve generated reports and static assets
-Path("out").mkdir(exist_ok=True)
+REPORTS_DIR = Path("out")
+REPORTS_DIR.mkdir(exist_ok=True)
+
+# Browsers keep reports but revalidate on every view: an unchanged file answers with an empty
+# 304 via its ETag/Last-Modified, while a regenerated one (new mtime/size) is sent again.
+REVALIDATE_HEADERS = {"Cache-Control": "no-cache"}
+# Reports with inlined attachments run to many MB; larger reads mean fewer syscalls per download.
+FILE_CHUNK_SIZE = 256 * 1024
 
 
 class NoCacheStaticFiles(StaticFiles):
-    """StaticFiles with no-cache headers to ensure refreshed report content."""
+    """StaticFiles that makes browsers revalidate, so refreshed report content is always picked up."""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.chunk_size = FILE_CHUNK_SIZE
+        return response
 
     async def get_response(self, path, scope):
         response = await super().get_response(path, scope)
         if response.status_code == 200:
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            response.headers.update(REVALIDATE_HEADERS)
         return response
 
 
-app.mount("/reports", NoCacheStaticFiles(directory="out"), name="reports")
+@app.api_route("/reports/{fname}", methods=["GET", "HEAD"], include_in_schema=False)
+def serve_report(fname: str, request: Request):
+    """Serve a generated report from out/ directly; reports are flat files, so no StaticFiles lookup is needed."""
+    path = REPORTS_DIR / fname
+    if fname.startswith(".") or Path(fname).name != fname:
+        raise HTTPException(status_code=404, detail="Report not found")
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="Report not found")
+    response = FileResponse(path, headers=REVALIDATE_HEADERS, stat_result=stat_result)
+    if request.headers.get("if-none-match") == response.headers["etag"]:
+        return Response(status_code=304, headers={"ETag": response.headers["etag"], **REVALIDATE_HEADERS})
+    response.chunk_size = FILE_CHUNK_SIZE
+    return response
+
+
 # Ensure output directory exists and mount it
 Path("output").mkdir(exist_ok=True)
 app.mount("/output", NoCacheStaticFiles(directory="output"), name="output")
 if Path("assets").exists():
     app.mount("/assets", StaticFiles(directory="assets"), name="assets")
 
-templates = Jinja2Templates(directory="templates")
+# Templates only change on deploy: skip the per-render mtime check and keep compiled
+# bytecode in the system temp dir so restarts do not re-parse them.
+templates = Jinja2Templates(directory="templates", auto_reload=False, bytecode_cache=FileSystemBytecodeCache())
 
 # Include API routers
 app.include_router(dashboard_router)
@@ -62,106 +102,137 @@ app.include_router(general_router)
 app.include_router(dataset_router)
 app.include_router(automation_router)
 
-# Keepalive and memory logging threads
-_keepalive_thread: threading.Thread | None = None
-_keepalive_stop = threading.Event()
-_memlog_thread: threading.Thread | None = None
-_memlog_stop = threading.Event()
+# Keepalive and memory logging tasks
+_keepalive_task: asyncio.Task | None = None
+_keepalive_stop: asyncio.Event | None = None
+_memlog_task: asyncio.Task | None = None
+_memlog_stop: asyncio.Event | None = None
+
+
+_ASSET_TOKEN_FILES = frozenset({"app.js", "dashboard.js", "dataset-nav.js", "dataset-nav.css"})
 
 
 def _asset_cache_token() -> str:
     """Use latest static/template mtime as a stable cache token."""
-    candidates = [
-        Path("templates/index.html"),
-        Path("assets/app.js"),
-        Path("assets/dashboard.js"),
-        Path("assets/dataset-nav.js"),
-        Path("assets/dataset-nav.css"),
-    ]
     latest_mtime = 0
-    for path in candidates:
-        try:
-            if path.exists():
-                latest_mtime = max(latest_mtime, int(path.stat().st_mtime))
-        except OSError:
-            continue
+    try:
+        latest_mtime = int(os.stat("templates/index.html").st_mtime)
+    except OSError:
+        pass
+    # One directory read; DirEntry.stat() reuses the already-open directory handle.
+    try:
+        with os.scandir("assets") as entries:
+            for entry in entries:
+                if entry.name in _ASSET_TOKEN_FILES and entry.is_file():
+                    latest_mtime = max(latest_mtime, int(entry.stat().st_mtime))
+    except OSError:
+        pass
     return str(latest_mtime or 1)
 
 
 ASSET_CACHE_TOKEN = _asset_cache_token()
 
 
-def _start_keepalive():
-    """Start keepalive thread if configured."""
-    url = os.getenv("KEEPALIVE_URL")
-    if not url:
-        return
+def _brand_colors() -> dict[str, str]:
+    """Brand colors can be customized via environment variables."""
+    return {
+        "primary": os.getenv("BRAND_PRIMARY", "#1A8A85"),
+        "primary_600": os.getenv("BRAND_PRIMARY_600", "#15736E"),
+        "bg": os.getenv("BRAND_BG", "#F8F9FA"),
+        "bg2": os.getenv("BRAND_BG2", "rgba(26,138,133,0.06)"),
+    }
+
+
+# Branding and asset versioning are fixed for the process lifetime; resolve them once
+# as template globals instead of rebuilding them for every page render.
+templates.env.globals.update(brand=_brand_colors(), logo_url="/assets/Bvt.jpg", cache_bust=ASSET_CACHE_TOKEN)
+templates.get_template("index.html")
+
+
+async def _wait_or_stop(stop: asyncio.Event, interval: int):
+    """Sleep for ``interval`` seconds, returning early once ``stop`` is set."""
     try:
-        interval = max(60, int(os.getenv("KEEPALIVE_INTERVAL", "240")))
-    except ValueError:
-        interval = 240
+        await asyncio.wait_for(stop.wait(), interval)
+    except asyncio.TimeoutError:
+        pass
 
-    def _loop():
-        while not _keepalive_stop.is_set():
+
+async def _keepalive_loop(url: str, interval: int, stop: asyncio.Event):
+    """Ping ``url`` every ``interval`` seconds until ``stop`` is set.
+
+    One client for the task's lifetime keeps the connection pooled across pings, and HEAD
+    skips transferring the response body.
+    """
+    async with httpx.AsyncClient(timeout=10) as client:
+        while not stop.is_set():
             try:
-                requests.get(url, timeout=10)
+                await client.head(url)
             except Exception:
                 pass
-            _keepalive_stop.wait(interval)
+            await _wait_or_stop(stop, interval)
 
-    global _keepalive_thread
-    if _keepalive_thread and _keepalive_thread.is_alive():
+
+async def _memlog_loop(interval: int, stop: asyncio.Event):
+    """Log RSS every ``interval`` seconds until ``stop`` is set; one psutil read, cheap enough for the loop."""
+    while not stop.is_set():
+        try:
+            log_memory("heartbeat")
+        except Exception:
+            pass
+        await _wait_or_stop(stop, interval)
+
+
+def _start_keepalive():
+    """Start keepalive task on the running event loop if configured."""
+    url = config.KEEPALIVE_URL
+    if not url:
         return
-    _keepalive_thread = threading.Thread(target=_loop, name="keepalive-thread", daemon=True)
-    _keepalive_thread.start()
+    interval = config.KEEPALIVE_INTERVAL
 
+    global _keepalive_task, _keepalive_stop
+    if _keepalive_task and not _keepalive_task.done():
+        return
+    _keepalive_stop = asyncio.Event()
+    _keepalive_task = asyncio.create_task(_keepalive_loop(url, interval, _keepalive_stop), name="keepalive-task")
 
-def _start_memlog():
-    """Start memory logging thread."""
-    try:
-        interval = max(30, int(os.getenv("MEM_LOG_INTERVAL", "60")))
-    except ValueError:
-        interval = 60
 
-    def _loop():
-        while not _memlog_stop.is_set():
-            try:
-                log_memory("heartbeat")
-            except Exception:
-                pass
-            _memlog_stop.wait(interval)
+def _start_memlog():
+    """Start memory logging task on the running event loop."""
+    interval = config.MEM_LOG_INTERVAL
 
-    global _memlog_thread
-    if _memlog_thread and _memlog_thread.is_alive():
+    global _memlog_task, _memlog_stop
+    if _memlog_task and not _memlog_task.done():
         return
-    _memlog_thread = threading.Thread(target=_loop, name="memlog-thread", daemon=True)
-    _memlog_thread.start()
+    _memlog_stop = asyncio.Event()
+    _memlog_task = asyncio.create_task(_memlog_loop(interval, _memlog_stop), name="memlog-task")
 
 
-def _stop_keepalive():
-    """Stop keepalive thread."""
-    global _keepalive_thread
-    if not _keepalive_thread:
+async def _stop_keepalive():
+    """Stop keepalive task."""
+    global _keepalive_task, _keepalive_stop
+    if not _keepalive_task:
         return
-    _keepalive_stop.set()
-    _keepalive_thread.join(timeout=5)
-    _keepalive_thread = None
-    _keepalive_stop.clear()
+    if _keepalive_stop:
+        _keepalive_stop.set()
+    await _keepalive_task
+    _keepalive_task = None
+    _keepalive_stop = None
 
 
-def _stop_memlog():
-    """Stop memory logging thread."""
-    global _memlog_thread
-    if not _memlog_thread:
+async def _stop_memlog():
+    """Stop memory logging task."""
+    global _memlog_task, _memlog_stop
+    if not _memlog_task:
         return
-    _memlog_stop.set()
-    _memlog_thread.join(timeout=5)
-    _memlog_thread = None
-    _memlog_stop.clear()
+    if _memlog_stop:
+        _memlog_stop.set()
+    await _memlog_task
+    _memlog_task = None
+    _memlog_stop = None
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     """Application startup event handler."""
     report_worker_count, report_worker_requested, report_worker_max = report_worker_config()
     report_workers = f"{report_worker_count} (max {report_worker_max})"
@@ -190,60 +261,40 @@ def on_startup():
 
 
 @app.on_event("shutdown")
-def on_shutdown():
+async def on_shutdown():
     """Application shutdown event handler."""
-    _stop_keepalive()
-    _stop_memlog()
+    await _stop_keepalive()
+    await _stop_memlog()
+
+
+@lru_cache(maxsize=8)
+def _render_index(default_suite_id, default_section_id) -> str:
+    """Render index.html once per config; the page does not depend on the request."""
+    return templates.get_template("index.html").render(
+        default_project=1, default_suite_id=default_suite_id, default_section_id=default_section_id
+    )
 
 
 @app.get("/", response_class=HTMLResponse)
 def index(request: Request):
     """Main index page."""
-    # Brand colors can be customized via environment variables
-    brand = {
-        "primary": os.getenv("BRAND_PRIMARY", "#1A8A85"),
-        "primary_600": os.getenv("BRAND_PRIMARY_600", "#15736E"),
-        "bg": os.getenv("BRAND_BG", "#F8F9FA"),
-        "bg2": os.getenv("BRAND_BG2", "rgba(26,138,133,0.06)"),
-    }
-    logo_url = "/assets/Bvt.jpg"
-
-    from app.core.config import config
-
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "default_project": 1,
-            "default_suite_id": config.DEFAULT_SUITE_ID,
-            "default_section_id": config.DEFAULT_SECTION_ID,
-            "brand": brand,
-            "logo_url": logo_url,
-            "cache_bust": ASSET_CACHE_TOKEN,
-        },
-    )
+    return HTMLResponse(_render_index(config.DEFAULT_SUITE_ID, config.DEFAULT_SECTION_ID))
 
 
 @app.post("/generate")
-def generate(
+async def generate(
     project: int = Form(1),
     plan_param: str = Form(""),  # matches <input name="plan">
     run_param: str = Form(""),  # matches <input name="run">
     run_ids: list[str] | None = Form(default=None),
 ):
     """Legacy form-based report generation endpoint."""
-    # Convert blank strings to None, otherwise parse to int
-    plan: int | None = int(plan_param) if plan_param.strip() else None
-    run: int | None = int(run_param) if run_param.strip() else None
-    selected_run_ids = [int(x) for x in run_ids] if run_ids else None
-
-    if selected_run_ids and plan is None:
-        raise HTTPException(status_code=400, detail="Run selection requires a plan")
-    if (plan is None and run is None) or (plan is not None and run is not None):
-        raise HTTPException(status_code=400, detail="Provide exactly one of plan or run")
+    plan, run, selected_run_ids = parse_report_form(project, plan_param, run_param, run_ids)
 
     try:
-        path = generate_report(project=project, plan=plan, run=run, run_ids=selected_run_ids)
+        path = await asyncio.to_thread(
+            generate_report_cached, project=project, plan=plan, run=run, run_ids=selected_run_ids
+        )
     except requests.exceptions.RequestException as e:
         raise HTTPException(status_code=502, detail=f"Error connecting to TestRail API: {e}")
     except ValueError as e:
@@ -252,7 +303,7 @@ def generate(
         # Catch any other unexpected errors
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
-    url = "/reports/" + Path(path).name
+    url = report_url(path)
     return RedirectResponse(url=url, status_code=303)
 
 
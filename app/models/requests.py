@@ -18,21 +18,13 @@ class ReportRequest(BaseModel):
             return None
         if isinstance(value, (str, int)):
             value = [value]
-        if isinstance(value, tuple):
-            value = list(value)
-        cleaned: list[int] = []
-        for item in value:
-            if item is None:
-                continue
-            text = str(item).strip()
-            if not text:
-                continue
-            cleaned.append(int(text))
+        # Drop empty form entries only; pydantic-core does the str -> int coercion (and strips).
+        cleaned = [item for item in value if item is not None and (not isinstance(item, str) or item.strip())]
         return cleaned or None
 
     @model_validator(mode="after")
     def _validate_constraints(self):
-        if (self.plan is None and self.run is None) or (self.plan is not None and self.run is not None):
+        if (self.plan is None) == (self.run is None):
             raise ValueError("Provide exactly one of plan or run")
         if self.run_ids and self.plan is None:
             raise ValueError("Run selection requires a plan")
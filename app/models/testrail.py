@@ -0,0 +1,64 @@
+"""Typed views over TestRail API payloads."""
+
+from typing import Any, Iterator
+
+from pydantic import BaseModel, field_validator
+
+
+def _dict_items(value: Any) -> list:
+    """Keep only dict items so one malformed entry does not discard the whole payload."""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+class PlanRun(BaseModel):
+    """A run inside a plan entry; ``id`` is None when TestRail returned something unusable."""
+
+    id: int | None = None
+    name: Any = None
+    suite_name: Any = None
+    is_completed: Any = None
+    updated_on: Any = None
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _coerce_id(cls, v):
+        try:
+            return int(v) if v else None
+        except (TypeError, ValueError):
+            return None
+
+
+class PlanEntry(BaseModel):
+    """A plan entry (suite) grouping one or more runs."""
+
+    name: Any = None
+    runs: list[PlanRun] = []
+
+    @field_validator("runs", mode="before")
+    @classmethod
+    def _filter_runs(cls, v):
+        return _dict_items(v)
+
+
+class PlanPayload(BaseModel):
+    """The subset of a ``get_plan`` response used to enumerate the plan's runs."""
+
+    entries: list[PlanEntry] = []
+
+    @field_validator("entries", mode="before")
+    @classmethod
+    def _filter_entries(cls, v):
+        return _dict_items(v)
+
+    def runs(self) -> Iterator[tuple[PlanEntry, PlanRun]]:
+        """Yield ``(entry, run)`` pairs for every run with a usable ID."""
+        for entry in self.entries:
+            for run in entry.runs:
+                if run.id:
+                    yield entry, run
+
+    def run_ids(self) -> list[int]:
+        """IDs of the runs yielded by :meth:`runs`, in plan order."""
+        return [run.id for _, run in self.runs() if run.id is not None]
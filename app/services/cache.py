@@ -1,71 +1,223 @@
 """Caching service with TTL support."""
 
+import hashlib
+import heapq
 import threading
 import time
-from collections import deque
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+# Entries older than this fraction of their TTL are reloaded in the background on a hit,
+# so pollers keep getting the current value instead of paying for the reload at expiry.
+REFRESH_AHEAD_FRACTION = 0.8
+# Expired entries purged per set(); keeps the sweep amortized instead of a full scan.
+EXPIRY_SWEEP_LIMIT = 8
+# After a failed background reload, hits skip refresh_ahead for this long so an upstream
+# outage is retried once per window rather than on every poll.
+REFRESH_RETRY_SECONDS = 10.0
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
 
 
 class TTLCache:
-    """Thread-safe TTL cache implementation."""
+    """Thread-safe TTL cache implementation.
+
+    Values are stored and returned by reference, not copied: treat cached payloads as
+    read-only and build a new dict (``{**payload, "meta": ...}``) to decorate a response.
+    """
 
     def __init__(self, ttl_seconds: int = 120, maxsize: int = 128):
         self.ttl = ttl_seconds
         self.maxsize = max(1, maxsize)
-        self._store: dict[tuple, tuple[float, Any]] = {}
-        self._order: deque[tuple] = deque()
+        # Eviction is CLOCK (second chance) over insertion order: reads only mark a key in
+        # _referenced, and set() gives marked keys one more pass before evicting.
+        # key -> (deadline, refresh_at, value, expires_at); deadline and refresh_at are on the
+        # monotonic clock so wall-clock jumps cannot skew TTLs, expires_at is wall time for display.
+        self._store: OrderedDict[tuple, tuple[float, float, Any, float]] = OrderedDict()
+        self._referenced: set[tuple] = set()
         self._lock = threading.Lock()
-
-    def _discard(self, key: tuple):
-        """Remove a key from cache."""
-        self._store.pop(key, None)
-        try:
-            self._order.remove(key)
-        except ValueError:
-            pass
-
-    def _record(self, key: tuple):
-        """Record key access for LRU eviction."""
-        try:
-            self._order.remove(key)
-        except ValueError:
-            pass
-        self._order.append(key)
-        while len(self._order) > self.maxsize:
-            oldest = self._order.popleft()
-            self._store.pop(oldest, None)
+        self._inflight: dict[tuple, Future] = {}
+        # key -> monotonic time before which a failed background reload is not retried.
+        self._refresh_failed_until: dict[tuple, float] = {}
+        # Min-heap of (deadline, key) so set() can purge expired entries nobody reads again.
+        self._expiry_heap: list[tuple[float, tuple]] = []
 
     def get(self, key: tuple):
-        """Get value from cache if not expired."""
-        now = time.time()
-        with self._lock:
-            entry = self._store.get(key)
-            if not entry:
-                return None
-            expires_at, value = entry
-            if expires_at <= now:
-                self._discard(key)
-                return None
-        return value.copy() if isinstance(value, dict) else value, expires_at
+        """Get value from cache if not expired.
+
+        Hits never take the lock: entries are immutable tuples, dict reads are atomic, and
+        recency is a set.add() on the CLOCK reference set, undone if the entry was evicted or
+        replaced meanwhile. The lock is only taken to drop an expired entry.
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        deadline, _, value, expires_at = entry
+        if deadline <= time.monotonic():
+            with self._lock:
+                if self._store.get(key) is entry:
+                    del self._store[key]
+                    self._referenced.discard(key)
+            return None
+        self._referenced.add(key)
+        if self._store.get(key) is not entry:
+            # Evicted or replaced concurrently: don't leave a bit behind for a key we never read.
+            self._referenced.discard(key)
+        return value, expires_at
 
     def set(self, key: tuple, value: Any, ttl_seconds: int | None = None):
         """Set value in cache with TTL."""
-        ttl = ttl_seconds if ttl_seconds is not None else self.ttl
-        expires_at = time.time() + max(1, ttl)
+        ttl = max(1, ttl_seconds if ttl_seconds is not None else self.ttl)
+        now = time.monotonic()
+        expires_at = time.time() + ttl
+        entry = (now + ttl, now + ttl * REFRESH_AHEAD_FRACTION, value, expires_at)
         with self._lock:
-            self._store[key] = (
-                expires_at,
-                value.copy() if isinstance(value, dict) else value,
-            )
-            self._record(key)
+            self._sweep_expired(now)
+            self._insert(key, entry)
         return expires_at
 
+    def set_many(self, items: Iterable[tuple[tuple, Any]], ttl_seconds: int | None = None) -> int:
+        """Set several ``(key, value)`` pairs under one lock acquisition; returns how many were set."""
+        ttl = max(1, ttl_seconds if ttl_seconds is not None else self.ttl)
+        now = time.monotonic()
+        expires_at = time.time() + ttl
+        deadline, refresh_at = now + ttl, now + ttl * REFRESH_AHEAD_FRACTION
+        count = 0
+        with self._lock:
+            self._sweep_expired(now)
+            for key, value in items:
+                self._insert(key, (deadline, refresh_at, value, expires_at))
+                count += 1
+        return count
+
+    def _insert(self, key: tuple, entry: tuple[float, float, Any, float]):
+        """Store ``entry`` under ``key``; caller holds the lock."""
+        if key not in self._store:
+            # Make room before inserting so the new entry is never the one evicted.
+            self._evict_overflow(self.maxsize - 1)
+            # A new key starts unreferenced, even if a racing get() left a stale bit behind.
+            self._referenced.discard(key)
+        self._store[key] = entry
+        self._store.move_to_end(key)
+        self._refresh_failed_until.pop(key, None)
+        heapq.heappush(self._expiry_heap, (entry[0], key))
+
+    def discard(self, key: tuple):
+        """Drop ``key`` if present, e.g. when the value it points at is gone."""
+        with self._lock:
+            self._store.pop(key, None)
+            self._referenced.discard(key)
+
+    def _evict_overflow(self, limit: int):
+        """Evict down to ``limit`` entries, CLOCK-style; caller holds the lock.
+
+        The hand is the front of the OrderedDict: a referenced key has its bit cleared and
+        goes to the back, the first unreferenced key is evicted. Bits only clear here, so
+        this ends within one pass.
+        """
+        store = self._store
+        referenced = self._referenced
+        while len(store) > limit:
+            key = next(iter(store))
+            if key in referenced:
+                referenced.discard(key)
+                store.move_to_end(key)
+            else:
+                del store[key]
+
+    def _sweep_expired(self, now: float):
+        """Drop up to EXPIRY_SWEEP_LIMIT expired entries; caller holds the lock.
+
+        Heap items whose key was re-set since are stale and only popped, never acted on.
+        """
+        heap = self._expiry_heap
+        for _ in range(EXPIRY_SWEEP_LIMIT):
+            if not heap or heap[0][0] > now:
+                return
+            deadline, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry[0] == deadline:
+                del self._store[key]
+                self._referenced.discard(key)
+
+    def get_or_compute(self, key: tuple, loader: Callable[[], Any], ttl_seconds: int | None = None):
+        """Return the cached ``(value, expires_at)`` for ``key``, calling ``loader`` on a miss.
+
+        Concurrent misses for the same key are coalesced: the first caller runs ``loader``
+        and the rest block on its result (or exception) instead of repeating the fetch.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                # Another caller finished loading between our miss and taking the lock.
+                return entry[2], entry[3]
+            waiting_on = self._inflight.get(key)
+            if waiting_on is None:
+                owned: Future = Future()
+                self._inflight[key] = owned
+        if waiting_on is not None:
+            value, expires_at = waiting_on.result()
+            return value, expires_at
+        value, expires_at = self._load(key, loader, ttl_seconds, owned)
+        return value, expires_at
+
+    def refresh_ahead(self, key: tuple, loader: Callable[[], Any], ttl_seconds: int | None = None) -> bool:
+        """Reload a live entry in the background once it is past its refresh point.
+
+        Never blocks on the load, so it is safe to call on a cache hit from the event loop.
+        Returns True while a reload for ``key`` is in flight.
+        """
+        now = time.monotonic()
+        entry = self._store.get(key)
+        if entry is None or entry[1] > now:
+            return False
+        with self._lock:
+            if key in self._inflight:
+                return True
+            if self._refresh_failed_until.get(key, 0.0) > now:
+                return False
+            future = self._inflight[key] = Future()
+        _refresh_executor.submit(self._background_load, key, loader, ttl_seconds, future)
+        return True
+
+    def _load(self, key: tuple, loader: Callable[[], Any], ttl_seconds: int | None, future: Future):
+        """Run ``loader`` for the caller owning ``future`` and publish the outcome to waiters."""
+        try:
+            value = loader()
+            expires_at = self.set(key, value, ttl_seconds)
+            future.set_result((value, expires_at))
+        except BaseException as exc:
+            with self._lock:
+                # Stamped before the in-flight future is dropped, so no refresh slips in between.
+                self._refresh_failed_until[key] = time.monotonic() + REFRESH_RETRY_SECONDS
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return value, expires_at
+
+    def _background_load(self, key: tuple, loader: Callable[[], Any], ttl_seconds: int | None, future: Future):
+        try:
+            self._load(key, loader, ttl_seconds, future)
+        except Exception as exc:
+            # The current entry stays in place until it expires; the next miss retries at once,
+            # refresh_ahead only after REFRESH_RETRY_SECONDS.
+            print(f"[cache] background refresh failed for {key}: {exc}", flush=True)
+
     def clear(self):
         """Clear all cache entries."""
         with self._lock:
             self._store.clear()
-            self._order.clear()
+            self._referenced.clear()
+            self._expiry_heap.clear()
+            self._refresh_failed_until.clear()
 
     def size(self) -> int:
         """Get current cache size."""
@@ -82,12 +234,25 @@ class TTLCache:
             }
 
 
-def cache_meta(hit: bool, expires_at: float) -> dict[str, Any]:
+@lru_cache(maxsize=512)
+def _expires_iso(expires_at: float) -> str:
+    """ISO timestamp for an entry's expiry; every hit on an entry shares the same float, so it formats once."""
+    return datetime.fromtimestamp(expires_at, timezone.utc).isoformat()
+
+
+def cache_meta(hit: bool, expires_at: float, refreshing: bool = False) -> dict[str, Any]:
     """Generate cache metadata for API responses."""
     return {
         "cache": {
             "hit": hit,
-            "expires_at": datetime.fromtimestamp(expires_at, timezone.utc).isoformat(),
+            "expires_at": _expires_iso(expires_at),
             "seconds_remaining": max(0, int(expires_at - time.time())),
+            "refreshing": refreshing,
         }
     }
+
+
+def weak_etag(value: Any) -> str:
+    """Build a weak ETag from a payload's repr so equal payloads share a tag."""
+    digest = hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
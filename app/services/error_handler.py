@@ -1,22 +1,24 @@
 """Comprehensive error handling service."""
 
-import uuid
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 
+from app.core.middleware import INTERNAL_ERROR_BODY, new_correlation_id
+
 
 class ErrorHandler:
     """Centralized error handling service."""
 
     @staticmethod
-    def handle_exception(exc: Exception, request: Request) -> JSONResponse:
+    def handle_exception(exc: Exception, request: Request) -> ORJSONResponse:
         """Handle any exception and return structured response."""
-        correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+        correlation_id = getattr(request.state, "correlation_id", None) or new_correlation_id()
         timestamp = datetime.utcnow().isoformat() + "Z"
 
         # Log the error with full context
@@ -31,55 +33,31 @@ class ErrorHandler:
         )
 
         if isinstance(exc, HTTPException):
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    "detail": exc.detail,
-                    "error_code": f"HTTP_{exc.status_code}",
-                    "timestamp": timestamp,
-                    "correlation_id": correlation_id,
-                },
-                headers={"X-Correlation-ID": correlation_id},
-            )
-
+            status_code = exc.status_code
+            body = {"detail": exc.detail, "error_code": f"HTTP_{exc.status_code}"}
         elif isinstance(exc, ValidationError):
-            return JSONResponse(
-                status_code=400,
-                content=ErrorHandler.format_validation_error(exc, correlation_id, timestamp),
-                headers={"X-Correlation-ID": correlation_id},
-            )
-
+            status_code = 400
+            body = ErrorHandler.format_validation_error(exc, correlation_id, timestamp)
         elif isinstance(exc, requests.exceptions.RequestException):
-            return JSONResponse(
-                status_code=502,
-                content={
-                    "detail": f"External API error: {str(exc)}",
-                    "error_code": "EXTERNAL_API_ERROR",
-                    "timestamp": timestamp,
-                    "correlation_id": correlation_id,
-                },
-                headers={"X-Correlation-ID": correlation_id},
-            )
-
+            status_code = 502
+            body = {"detail": f"External API error: {str(exc)}", "error_code": "EXTERNAL_API_ERROR"}
         else:
             # Generic server error
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "detail": "An unexpected error occurred",
-                    "error_code": "INTERNAL_SERVER_ERROR",
-                    "timestamp": timestamp,
-                    "correlation_id": correlation_id,
-                },
-                headers={"X-Correlation-ID": correlation_id},
-            )
+            status_code = 500
+            body = INTERNAL_ERROR_BODY
+
+        return ORJSONResponse(
+            status_code=status_code,
+            content={**body, "timestamp": timestamp, "correlation_id": correlation_id},
+            headers={"X-Correlation-ID": correlation_id},
+        )
 
     @staticmethod
     def log_error(exc: Exception, context: Dict[str, Any]) -> str:
         """Log error with context and return correlation ID."""
         correlation_id = context.get("correlation_id")
         if correlation_id is None:
-            correlation_id = str(uuid.uuid4())
+            correlation_id = new_correlation_id()
 
         print(f"[ERROR] {correlation_id} - {type(exc).__name__}: {str(exc)} - " f"Context: {context}", flush=True)
 
@@ -88,22 +66,18 @@ class ErrorHandler:
     @staticmethod
     def format_validation_error(exc: ValidationError, correlation_id: str, timestamp: str) -> Dict[str, Any]:
         """Format Pydantic validation error into structured response."""
-        field_errors: Dict[str, List[str]] = {}
-
-        for error in exc.errors():
-            field_path = ".".join(str(loc) for loc in error["loc"])
-            message = error["msg"]
+        field_errors: defaultdict[str, List[str]] = defaultdict(list)
 
-            if field_path not in field_errors:
-                field_errors[field_path] = []
-            field_errors[field_path].append(message)
+        # Only loc and msg are used, so skip building the docs URL, context and input per error.
+        for error in exc.errors(include_url=False, include_context=False, include_input=False):
+            field_errors[".".join(map(str, error["loc"]))].append(error["msg"])
 
         return {
             "detail": "Validation error",
             "error_code": "VALIDATION_ERROR",
             "timestamp": timestamp,
             "correlation_id": correlation_id,
-            "field_errors": field_errors,
+            "field_errors": dict(field_errors),
         }
 
     @staticmethod
@@ -112,7 +86,7 @@ class ErrorHandler:
     ) -> HTTPException:
         """Create HTTPException with structured detail."""
         if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+            correlation_id = new_correlation_id()
 
         if not error_code:
             error_code = f"HTTP_{status_code}"
@@ -1,32 +1,65 @@
 """Performance optimization service with advanced caching and streaming."""
 
 import asyncio
+import gc
+import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Callable, Dict, List, cast
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, Iterator, List, cast
+
+import anyio
+import anyio.to_thread
 
 from app.core.config import config
 from app.services.cache import TTLCache
 
+try:
+    import psutil  # type: ignore
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None  # type: ignore[assignment]
+    PSUTIL_AVAILABLE = False
+
+# Floor for the streaming executor; it was a fixed 4 threads before it became configurable.
+PERF_EXECUTOR_MIN_WORKERS = 4
+
+
+def _pull_chunk(items: Iterator[Any], size: int) -> List[Any]:
+    """Take up to ``size`` items from ``items``; runs on the executor since generators may block."""
+    return list(islice(items, size))
+
 
 class PerformanceService:
     """Service for performance optimizations including streaming and batching."""
 
     def __init__(self):
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Grows with the report worker count, never below the historical 4 threads; PERF_IO_WORKERS
+        # can only raise it further for I/O-bound streams.
+        workers = max(
+            PERF_EXECUTOR_MIN_WORKERS,
+            min(config.REPORT_WORKERS, config.REPORT_WORKERS_MAX),
+            config.PERF_IO_WORKERS,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="perfsvc")
         self._cache_warming_active = False
         self._cache_warming_lock = threading.Lock()
 
     async def stream_large_dataset(
-        self, data_generator: Callable[..., Any], chunk_size: int = 100, **kwargs
+        self, data_generator: Callable[..., Iterable[Any]], chunk_size: int = 100, **kwargs
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Stream large datasets in chunks to maintain stable memory usage.
 
+        The generator is consumed one chunk at a time on the executor, so at most two chunks
+        (the current one and the lookahead for ``has_more``) are held in memory.
+
         Args:
-            data_generator: Function that generates data
+            data_generator: Function returning an iterable (ideally a generator) of items
             chunk_size: Size of each chunk to yield
             **kwargs: Arguments to pass to data_generator
 
@@ -36,14 +69,15 @@ class PerformanceService:
         chunk_count = 0
         total_items = 0
         start_time = time.time()
+        loop = asyncio.get_running_loop()
 
         try:
-            # Get data from generator
-            data: List[Any] = await asyncio.get_event_loop().run_in_executor(self._executor, data_generator, **kwargs)
+            items = iter(await loop.run_in_executor(self._executor, partial(data_generator, **kwargs)))
+            chunk = await loop.run_in_executor(self._executor, _pull_chunk, items, chunk_size)
 
             # Stream data in chunks
-            for i in range(0, len(data), chunk_size):
-                chunk = data[i : i + chunk_size]
+            while chunk:
+                next_chunk = await loop.run_in_executor(self._executor, _pull_chunk, items, chunk_size)
                 chunk_count += 1
                 total_items += len(chunk)
 
@@ -52,12 +86,10 @@ class PerformanceService:
                     "data": chunk,
                     "chunk_size": len(chunk),
                     "total_processed": total_items,
-                    "has_more": i + chunk_size < len(data),
+                    "has_more": bool(next_chunk),
                     "processing_time": time.time() - start_time,
                 }
-
-                # Allow other coroutines to run
-                await asyncio.sleep(0)
+                chunk = next_chunk
 
         except Exception as e:
             yield {"error": str(e), "chunk_id": chunk_count, "total_processed": total_items, "has_more": False}
@@ -81,12 +113,7 @@ class PerformanceService:
 
         try:
             start_time = time.time()
-            warmed_count = 0
-
-            for key, value in warm_data:
-                cache.set(key, value)
-                warmed_count += 1
-
+            warmed_count = cache.set_many(warm_data)
             duration = time.time() - start_time
 
             return {
@@ -115,13 +142,15 @@ class PerformanceService:
         Returns:
             List of processed results
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Batches run on the shared anyio worker pool (the one Starlette uses), bounded by the
+        # limiter, rather than on self._executor where max_concurrent would be capped by its size.
+        limiter = anyio.CapacityLimiter(max_concurrent)
+
+        def run_batch(batch):
+            return [processor(item) for item in batch]
 
         async def process_batch(batch):
-            async with semaphore:
-                return await asyncio.get_event_loop().run_in_executor(
-                    self._executor, lambda: [processor(item) for item in batch]
-                )
+            return await anyio.to_thread.run_sync(run_batch, batch, limiter=limiter)
 
         # Create batches
         batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
@@ -180,13 +209,18 @@ class PerformanceService:
         """
         Context manager to monitor memory usage during operations.
 
+        Without psutil there is nothing to measure, so it only yields the threshold.
+
         Args:
             threshold_mb: Memory threshold in MB to warn about
         """
-        import gc
+        if not PSUTIL_AVAILABLE:
+            yield {"start_memory_mb": 0, "threshold_mb": threshold_mb}
+            return
 
-        # Force garbage collection before starting
-        gc.collect()
+        # Full collections pause the process; only pay for them when debugging growth.
+        if config.PERF_MEMORY_MONITOR_GC:
+            gc.collect()
 
         start_memory = self._get_memory_usage()
         start_time = time.time()
@@ -194,8 +228,8 @@ class PerformanceService:
         try:
             yield {"start_memory_mb": start_memory / (1024 * 1024), "threshold_mb": threshold_mb}
         finally:
-            # Force garbage collection after operation
-            gc.collect()
+            if config.PERF_MEMORY_MONITOR_GC:
+                gc.collect()
 
             end_memory = self._get_memory_usage()
             duration = time.time() - start_time
@@ -207,17 +241,10 @@ class PerformanceService:
             print(f"📊 Memory usage: {memory_growth:+.2f}MB over {duration:.2f}s")
 
     def _get_memory_usage(self) -> int:
-        """Get current memory usage in bytes."""
-        try:
-            import os
-
-            import psutil  # type: ignore
-
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss
-        except ImportError:
-            # Fallback without psutil
+        """Get current memory usage in bytes (0 without psutil)."""
+        if not PSUTIL_AVAILABLE:
             return 0
+        return psutil.Process(os.getpid()).memory_info().rss
 
 
 # Global performance service instance
@@ -1,15 +1,35 @@
 """Enhanced TestRail client service with retry logic and connection pooling."""
 
+import asyncio
+import random
 import time
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 from typing import Any, Callable, List, Optional
 
+import anyio
+import anyio.to_thread
 import requests
 from urllib3.util.retry import Retry
 
 from app.core.dependencies import get_testrail_client
 from testrail_client import TestRailClient
 
+# Retry objects are immutable (urllib3 returns a new one per increment), so one instance
+# serves every session and adapter.
+RETRY_STRATEGY = Retry(
+    total=3,
+    status_forcelist=frozenset({429, 500, 502, 503, 504}),
+    allowed_methods=frozenset({"HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"}),
+    backoff_factor=1,
+    raise_on_status=False,
+)
+
+# Batch workers live as long as the process: TestRailClient keeps one session per thread,
+# so reusing the threads reuses their sessions and keep-alive connections across batches.
+BATCH_MAX_WORKERS = 8
+_batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix="trbatch")
+
 
 class TestRailClientService:
     """Enhanced TestRail client with retry logic and connection pooling."""
@@ -35,20 +55,11 @@ class TestRailClientService:
                     # If we can't set the session on the client, store it separately
                     self._session = session
 
-            # Configure retry strategy
-            retry_strategy = Retry(
-                total=3,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
-                backoff_factor=1,
-                raise_on_status=False,
-            )
-
             # Configure HTTP adapter with connection pooling
             adapter = requests.adapters.HTTPAdapter(
                 pool_connections=10,
                 pool_maxsize=20,
-                max_retries=retry_strategy,
+                max_retries=RETRY_STRATEGY,
             )
 
             session.mount("http://", adapter)
@@ -70,6 +81,27 @@ class TestRailClientService:
 
         return self._client
 
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        """Return True for transient transport errors and retryable HTTP statuses."""
+        if isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return True
+        if isinstance(exc, ConnectionError):  # Built-in ConnectionError
+            return True
+        if hasattr(exc, "response") and exc.response is not None:
+            return exc.response.status_code in [429, 500, 502, 503, 504]
+        return False
+
+    @staticmethod
+    def _backoff_delay(attempt: int, base_delay: float) -> float:
+        """Exponential backoff with "equal jitter": half the step is fixed, half is random.
+
+        Independent random draws keep retries from different workers from re-colliding,
+        while the fixed half keeps each step longer than the one before it.
+        """
+        half_step = base_delay * (2**attempt) / 2
+        return half_step + random.uniform(0, half_step)
+
     def with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with exponential backoff retry logic."""
         max_attempts = 3
@@ -80,24 +112,10 @@ class TestRailClientService:
                 return func(*args, **kwargs)
 
             except (requests.exceptions.RequestException, ConnectionError) as e:
-                if attempt == max_attempts - 1:
+                if attempt == max_attempts - 1 or not self._is_retryable(e):
                     raise
 
-                # Check if it's a retryable error
-                if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
-                    retryable = True
-                elif isinstance(e, ConnectionError):  # Built-in ConnectionError
-                    retryable = True
-                elif hasattr(e, "response") and e.response is not None:
-                    retryable = e.response.status_code in [429, 500, 502, 503, 504]
-                else:
-                    retryable = False
-
-                if not retryable:
-                    raise
-
-                # Calculate delay with exponential backoff and jitter
-                delay = base_delay * (2**attempt) + (time.time() % 1)  # Add jitter
+                delay = self._backoff_delay(attempt, base_delay)
                 print(f"Retrying TestRail request in {delay:.2f}s (attempt {attempt + 1}/{max_attempts})")
                 time.sleep(delay)
 
@@ -105,38 +123,59 @@ class TestRailClientService:
                 # Non-retryable exceptions
                 raise
 
+    async def with_retry_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Async variant of with_retry: calls run in a worker thread and backoff awaits."""
+        max_attempts = 3
+        base_delay = 1.0
+
+        for attempt in range(max_attempts):
+            try:
+                return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+            except (requests.exceptions.RequestException, ConnectionError) as e:
+                if attempt == max_attempts - 1 or not self._is_retryable(e):
+                    raise
+
+                delay = self._backoff_delay(attempt, base_delay)
+                print(f"Retrying TestRail request in {delay:.2f}s (attempt {attempt + 1}/{max_attempts})")
+                await asyncio.sleep(delay)
+
     def batch_requests(self, requests_data: List[dict]) -> List[Any]:
-        """Execute multiple requests efficiently with batching."""
+        """Execute multiple requests concurrently, returning results in request order."""
         client = self.get_client()
-        results = []
-
-        # For now, execute requests sequentially with retry logic
-        # In the future, this could be enhanced with actual batching if TestRail supports it
-        for request_data in requests_data:
+        # Bound methods and their payload keyword, resolved once per batch. A client lacking a
+        # verb fails only the requests that use it, as before.
+        dispatch = {
+            method: (getattr(client, method.lower(), None), payload_kw)
+            for method, payload_kw in (("GET", "params"), ("POST", "json"), ("PUT", "json"), ("DELETE", None))
+        }
+
+        def _one(request_data: dict) -> Any:
             method = request_data.get("method")
             endpoint = request_data.get("endpoint")
             params = request_data.get("params", {})
 
             try:
-                if method == "GET":
-                    result = self.with_retry(getattr(client, "get"), endpoint, params=params)
-                elif method == "POST":
-                    result = self.with_retry(getattr(client, "post"), endpoint, json=params)
-                elif method == "PUT":
-                    result = self.with_retry(getattr(client, "put"), endpoint, json=params)
-                elif method == "DELETE":
-                    result = self.with_retry(getattr(client, "delete"), endpoint)
-                else:
+                if method not in dispatch:
                     raise ValueError(f"Unsupported HTTP method: {method}")
-
-                results.append(result)
+                fn, payload_kw = dispatch[method]
+                if fn is None:
+                    raise AttributeError(f"{type(client).__name__} has no {method.lower()}()")
+                kwargs = {payload_kw: params} if payload_kw else {}
+                return self.with_retry(fn, endpoint, **kwargs)
 
             except Exception as e:
                 # Log error but continue with other requests
-                print(f"Batch request failed: {method} {endpoint} - {str(e)}")
-                results.append(None)
+                print(f"Batch request failed: {method} {endpoint} - {str(e)}", flush=True)
+                return None
+
+        # Requests overlap on the shared batch pool, so latency is the slowest request rather
+        # than the sum; map() keeps results aligned with requests_data.
+        return list(_batch_executor.map(_one, requests_data))
 
-        return results
+    async def batch_requests_async(self, requests_data: List[dict]) -> List[Any]:
+        """Run batch_requests off the event loop."""
+        return await anyio.to_thread.run_sync(partial(self.batch_requests, requests_data))
 
 
 # Global service instance
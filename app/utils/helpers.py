@@ -1,9 +1,9 @@
 """Utility helper functions."""
 
 import os
-import time
-from datetime import datetime, timezone
-from typing import Any, Dict
+
+# Single implementation (with its memoized expiry formatting) lives with the cache.
+from app.services.cache import cache_meta  # noqa: F401
 
 
 def int_env(name: str, default: int) -> int:
@@ -14,17 +14,6 @@ def int_env(name: str, default: int) -> int:
         return default
 
 
-def cache_meta(hit: bool, expires_at: float) -> Dict[str, Any]:
-    """Generate cache metadata for API responses."""
-    return {
-        "cache": {
-            "hit": hit,
-            "expires_at": datetime.fromtimestamp(expires_at, timezone.utc).isoformat(),
-            "seconds_remaining": max(0, int(expires_at - time.time())),
-        }
-    }
-
-
 def report_worker_config() -> tuple[int, int, int]:
     """Get report worker configuration."""
     try:
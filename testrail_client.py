@@ -1,10 +1,12 @@
 import contextlib
 import contextvars
 import os
+import random
 import sys
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -73,6 +75,21 @@ class AttachmentTooLarge(Exception):
         self.limit_bytes = limit_bytes
 
 
+def _retry_wait(response, delay: float) -> float:
+    """Seconds to sleep before a retry.
+
+    A 429's Retry-After is honored when it asks for longer than the local backoff, and a little
+    jitter keeps parallel report workers from hitting TestRail's rate limit again in lockstep.
+    """
+    wait_for = delay
+    if response is not None and response.status_code == 429:
+        try:
+            wait_for = max(delay, float(response.headers.get("Retry-After") or 0))
+        except (TypeError, ValueError):
+            pass
+    return wait_for + random.uniform(0, delay * 0.1)
+
+
 def api_get(
     session: requests.Session,
     base_url: str,
@@ -112,7 +129,7 @@ def api_get(
             retryable = status_code == 429 or (status_code is not None and 500 <= status_code < 600)
             if not retryable or attempt == attempts:
                 raise
-            time.sleep(delay)
+            time.sleep(_retry_wait(exc.response, delay))
             delay *= 1.6
         except (
             requests.exceptions.Timeout,
@@ -186,7 +203,7 @@ def api_post(
             retryable = status_code == 429 or (status_code is not None and 500 <= status_code < 600)
             if not retryable or attempt == attempts:
                 raise
-            time.sleep(delay)
+            time.sleep(_retry_wait(exc.response, delay))
             delay *= 1.6
         except (
             requests.exceptions.Timeout,
@@ -767,14 +784,32 @@ class TestRailClient:
     timeout: float = DEFAULT_HTTP_TIMEOUT
     max_attempts: int = DEFAULT_HTTP_RETRIES
     backoff: float = DEFAULT_HTTP_BACKOFF
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
 
     def make_session(self) -> requests.Session:
         sess = requests.Session()
         sess.auth = self.auth
         return sess
 
+    def thread_session(self) -> requests.Session:
+        """Return this thread's long-lived session so keep-alive connections survive across calls.
+
+        requests.Session is not safe to share between threads, so each worker thread keeps its
+        own; the client itself is cached per credential set and outlives individual requests.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.make_session()
+            self._local.session = session
+        return session
+
+    @contextlib.contextmanager
+    def pooled_session(self):
+        """Context-manager form of thread_session(); the session is left open for reuse."""
+        yield self.thread_session()
+
     def get_project(self, project_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_project(
                 session,
                 self.base_url,
@@ -785,7 +820,7 @@ class TestRailClient:
             )
 
     def get_plan(self, plan_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_plan(
                 session,
                 self.base_url,
@@ -796,7 +831,7 @@ class TestRailClient:
             )
 
     def get_plan_runs(self, plan_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_plan_runs(
                 session,
                 self.base_url,
@@ -807,7 +842,7 @@ class TestRailClient:
             )
 
     def get_tests_for_run(self, run_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_tests_for_run(
                 session,
                 self.base_url,
@@ -819,7 +854,7 @@ class TestRailClient:
 
     def get_run(self, run_id: int):
         """Fetch a single run by ID."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_get(
                 session,
                 self.base_url,
@@ -830,7 +865,7 @@ class TestRailClient:
             )
 
     def get_results_for_run(self, run_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_results_for_run(
                 session,
                 self.base_url,
@@ -851,7 +886,7 @@ class TestRailClient:
         max_plans: int | None = None,
         page_limit: int | None = None,
     ):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_plans_for_project(
                 session,
                 self.base_url,
@@ -868,7 +903,7 @@ class TestRailClient:
             )
 
     def get_users_map(self):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_users_map(
                 session,
                 self.base_url,
@@ -878,7 +913,7 @@ class TestRailClient:
             )
 
     def get_user(self, user_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_user(
                 session,
                 self.base_url,
@@ -889,7 +924,7 @@ class TestRailClient:
             )
 
     def get_priorities_map(self):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_priorities_map(
                 session,
                 self.base_url,
@@ -899,7 +934,7 @@ class TestRailClient:
             )
 
     def get_statuses_map(self, defaults: dict | None = None):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_statuses_map(
                 session,
                 self.base_url,
@@ -910,7 +945,7 @@ class TestRailClient:
             )
 
     def get_attachments_for_test(self, test_id: int):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_attachments_for_test(
                 session,
                 self.base_url,
@@ -926,7 +961,7 @@ class TestRailClient:
         suite_id: int | None = None,
         section_id: int | None = None,
     ):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_cases(
                 session,
                 self.base_url,
@@ -940,7 +975,7 @@ class TestRailClient:
 
     def get_case(self, case_id: int):
         """Get a single test case by ID."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return get_case(
                 session,
                 self.base_url,
@@ -951,7 +986,7 @@ class TestRailClient:
             )
 
     def download_attachment(self, attachment_id: int, *, size_limit: int | None = None, max_retries: int = 4):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return download_attachment(
                 session,
                 self.base_url,
@@ -964,7 +999,7 @@ class TestRailClient:
 
     # Write operations
     def add_plan(self, project_id: int, payload: dict[str, Any]):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -976,7 +1011,7 @@ class TestRailClient:
             )
 
     def add_run(self, project_id: int, payload: dict[str, Any]):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -988,7 +1023,7 @@ class TestRailClient:
             )
 
     def add_plan_entry(self, plan_id: int, payload: dict[str, Any]):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1001,7 +1036,7 @@ class TestRailClient:
 
     def update_plan_entry(self, plan_id: int, entry_id: str, payload: dict[str, Any]):
         """Update a test plan entry (run within a plan)."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1014,7 +1049,7 @@ class TestRailClient:
 
     def delete_plan_entry(self, plan_id: int, entry_id: str):
         """Delete a test plan entry (run within a plan)."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1026,7 +1061,7 @@ class TestRailClient:
             )
 
     def add_case(self, section_id: int, payload: dict[str, Any]):
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1039,7 +1074,7 @@ class TestRailClient:
 
     def update_plan(self, plan_id: int, payload: dict[str, Any]):
         """Update an existing test plan."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1052,7 +1087,7 @@ class TestRailClient:
 
     def update_run(self, run_id: int, payload: dict[str, Any]):
         """Update an existing test run."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1065,7 +1100,7 @@ class TestRailClient:
 
     def update_case(self, case_id: int, payload: dict[str, Any]):
         """Update an existing test case."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1078,7 +1113,7 @@ class TestRailClient:
 
     def delete_plan(self, plan_id: int):
         """Delete a test plan."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1091,7 +1126,7 @@ class TestRailClient:
 
     def delete_run(self, run_id: int):
         """Delete a test run."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1104,7 +1139,7 @@ class TestRailClient:
 
     def delete_case(self, case_id: int):
         """Delete a test case."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1117,7 +1152,7 @@ class TestRailClient:
 
     def get_attachments_for_case(self, case_id: int):
         """Get all attachments for a test case."""
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             try:
                 data = api_get(
                     session,
@@ -1152,7 +1187,7 @@ class TestRailClient:
             Attachment metadata from TestRail API
         """
         url = f"{self.base_url}/index.php?/api/v2/add_attachment_to_case/{case_id}"
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             start = time.perf_counter()
             try:
                 with open(file_path, "rb") as f:
@@ -1188,7 +1223,7 @@ class TestRailClient:
         Returns:
             Result data from TestRail API
         """
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             return api_post(
                 session,
                 self.base_url,
@@ -1212,7 +1247,7 @@ class TestRailClient:
             Attachment metadata from TestRail API
         """
         url = f"{self.base_url}/index.php?/api/v2/add_attachment_to_result/{result_id}"
-        with self.make_session() as session:
+        with self.pooled_session() as session:
             start = time.perf_counter()
             try:
                 with open(file_path, "rb") as f:
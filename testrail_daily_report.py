@@ -23,7 +23,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Literal, TypedDict, cast
+from typing import Any, Literal, TypedDict, cast
 
 import pandas as pd
 import requests
@@ -59,8 +59,10 @@ try:
 except ImportError:  # pragma: no cover - psutil optional
     psutil = None  # type: ignore
 
-# Ensure .env overrides any existing env so local config is honored
-load_dotenv(override=True)
+# Ensure .env overrides any existing env so local config is honored when run as a CLI.
+# The web app loads .env once via app.core.bootstrap before importing this module.
+if __name__ == "__main__":
+    load_dotenv(override=True)
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -93,6 +95,20 @@ DEFAULT_STATUS_MAP = {
     5: "Failed",
 }
 
+# Donut chart colors, keyed by lower-cased status label so lookups are case-insensitive.
+STATUS_COLORS_LC = {
+    "passed": "#16a34a",
+    "failed": "#ef4444",
+    "blocked": "#f59e0b",
+    "retest": "#3b82f6",
+    "untested": "#9ca3af",
+}
+DEFAULT_STATUS_COLOR = "#6b7280"
+
+
+def _status_color(label: Any) -> str:
+    return STATUS_COLORS_LC.get(str(label).lower(), DEFAULT_STATUS_COLOR)
+
 
 def env_or_die(key: str) -> str:
     v = os.getenv(key)
@@ -393,6 +409,33 @@ def compress_image_data(data: bytes, content_type: str | None):
         return data, content_type
 
 
+# Attachments are almost always screenshots, recordings or documents; resolving those from a
+# small table avoids loading the system MIME database just to label them.
+ATTACHMENT_MIME_BY_EXT = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".webm": "video/webm",
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".log": "text/plain",
+    ".json": "application/json",
+    ".html": "text/html",
+}
+
+
+def _guess_attachment_type(filename: str) -> str | None:
+    """MIME type for an attachment name, consulting ``mimetypes`` only for uncommon extensions."""
+    mime = ATTACHMENT_MIME_BY_EXT.get(Path(filename).suffix.lower())
+    if mime:
+        return mime
+    return mimetypes.guess_type(filename)[0]
+
+
 def _build_data_url(payload: bytes | None, content_type: str | None) -> str | None:
     if not payload:
         return None
@@ -404,6 +447,25 @@ def _build_data_url(payload: bytes | None, content_type: str | None) -> str | No
     return f"data:{mime};base64,{data_b64}"
 
 
+# Multiple of 3 so per-chunk base64 output concatenates without padding in between.
+DATA_URL_CHUNK_BYTES = 3 * 64 * 1024
+
+
+def _build_data_url_from_file(path: Path, content_type: str | None) -> str | None:
+    """Base64-encode a file into a data URL chunk by chunk, never holding its raw bytes in full."""
+    mime = content_type or "application/octet-stream"
+    parts = [f"data:{mime};base64,"]
+    try:
+        with path.open("rb") as handle:
+            while chunk := handle.read(DATA_URL_CHUNK_BYTES):
+                parts.append(base64.b64encode(chunk).decode("ascii"))
+    except OSError:
+        return None
+    if len(parts) == 1:
+        return None
+    return "".join(parts)
+
+
 def process_run_attachments(
     rid: int,
     latest_result_ids: dict[int, int],
@@ -449,7 +511,7 @@ def process_run_attachments(
                 except (TypeError, ValueError):
                     continue
                 filename = att.get("name") or att.get("filename") or f"attachment_{attachment_id}"
-                inferred_type = att.get("content_type") or att.get("mime_type") or mimetypes.guess_type(filename)[0]
+                inferred_type = att.get("content_type") or att.get("mime_type") or _guess_attachment_type(filename)
                 size_hint = att.get("size")
                 download_jobs.append(
                     {
@@ -566,6 +628,7 @@ def process_run_attachments(
 
         size_bytes = job.get("size") or 0
         inline_payload = None
+        inline_data_url = None
         final_type = content_type
 
         def _tmp_size(path: Path | None) -> int:
@@ -623,7 +686,7 @@ def process_run_attachments(
                     and 0 < size_bytes <= inline_video_limit
                     and final_path.exists()
                 ):
-                    inline_payload = final_path.read_bytes()
+                    inline_data_url = _build_data_url_from_file(final_path, final_type)
                 for path in cleanup_paths:
                     if path is not None:
                         path.unlink(missing_ok=True)
@@ -634,7 +697,7 @@ def process_run_attachments(
             if tmp_path is not None:
                 tmp_path.unlink(missing_ok=True)
 
-        data_url = _build_data_url(inline_payload, final_type)
+        data_url = inline_data_url or _build_data_url(inline_payload, final_type)
         entry = {
             "name": job["filename"],
             "path": None,
@@ -1100,24 +1163,16 @@ def generate_report(
 
         # Build run-level donut segments/style
         def _build_segments(counts: dict[str, int]):
-            status_colors = {
-                "Passed": "#16a34a",
-                "Failed": "#ef4444",
-                "Blocked": "#f59e0b",
-                "Retest": "#3b82f6",
-                "Untested": "#9ca3af",
-            }
             total = sum(counts.values())
             segments = []
             donut_style = "conic-gradient(#e5e7eb 0 100%)"
             if total > 0:
                 cumulative = 0.0
-                colors_lc = {k.lower(): v for k, v in status_colors.items()}
                 for label, count in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
                     pct = (count / total) * 100.0
                     start = cumulative
                     end = cumulative + pct
-                    color = colors_lc.get(str(label).lower(), "#6b7280")
+                    color = _status_color(label)
                     segments.append(
                         {
                             "label": label,
@@ -1282,24 +1337,16 @@ def generate_report(
     notify("runs_cached", count=cached_runs, expected=total_runs)
     pass_rate = round((cast(int, summary["Passed"]) / cast(int, summary["total"])) * 100, 2) if summary["total"] else 0  # type: ignore # type: ignore # type: ignore
     # Donut segments
-    status_colors = {
-        "Passed": "#16a34a",
-        "Failed": "#ef4444",
-        "Blocked": "#f59e0b",
-        "Retest": "#3b82f6",
-        "Untested": "#9ca3af",
-    }
     status_counts = summary.get("by_status", {})
     total_for_chart = sum(status_counts.values())  # type: ignore
     segments = []
     if total_for_chart > 0:
         cumulative = 0.0
-        colors_lc = {k.lower(): v for k, v in status_colors.items()}
         for label, count in sorted(status_counts.items(), key=lambda kv: (-kv[1], kv[0])):
             pct = (count / total_for_chart) * 100.0
             start = cumulative
             end = cumulative + pct
-            color = colors_lc.get(str(label).lower(), "#6b7280")
+            color = _status_color(label)
             segments.append(
                 {
                     "label": label,
@@ -1,7 +1,19 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 root_str = str(ROOT)
 if root_str not in sys.path:
     sys.path.insert(0, root_str)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_testrail_credentials():
+    """Tests patch TESTRAIL_* env vars; start each one without credentials cached by another."""
+    from app.core.dependencies import get_testrail_credentials
+
+    get_testrail_credentials.cache_clear()
+    yield
+    get_testrail_credentials.cache_clear()
@@ -5,6 +5,7 @@ This module contains both property-based tests and unit tests for the
 dashboard statistics functions.
 """
 
+import threading
 import unittest
 from unittest.mock import Mock
 
@@ -12,10 +13,12 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from app.dashboard_stats import (
+    RUN_STATS_MAX_WORKERS,
     calculate_completion_rate,
     calculate_pass_rate,
     calculate_plan_statistics,
     calculate_run_statistics,
+    calculate_run_statistics_bulk,
     calculate_status_distribution,
 )
 from testrail_client import TestRailClient
@@ -351,5 +354,54 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(distribution.get("Passed"), 1)
 
 
+class TestRunStatisticsBulk(unittest.TestCase):
+    """Bulk run statistics should match per-run results and isolate failures."""
+
+    def test_bulk_fetches_each_run_once(self):
+        mock_client = Mock(spec=TestRailClient)
+        mock_client.get_tests_for_run.side_effect = lambda run_id: [{"id": run_id, "status_id": 1}]
+
+        stats = calculate_run_statistics_bulk([3, 1, 3], mock_client)
+
+        self.assertEqual(list(stats), [3, 1])
+        self.assertEqual(stats[3].run_id, 3)
+        self.assertEqual(stats[1].total_tests, 1)
+        self.assertEqual(mock_client.get_tests_for_run.call_count, 2)
+
+    def test_bulk_captures_failures_per_run(self):
+        mock_client = Mock(spec=TestRailClient)
+
+        def _tests(run_id):
+            if run_id == 2:
+                raise RuntimeError("boom")
+            return [{"id": 1, "status_id": 5}]
+
+        mock_client.get_tests_for_run.side_effect = _tests
+
+        stats = calculate_run_statistics_bulk([1, 2], mock_client)
+
+        self.assertEqual(stats[1].status_distribution, {"Failed": 1})
+        self.assertIsInstance(stats[2], ValueError)
+
+    def test_bulk_calls_reuse_long_lived_workers(self):
+        threads = set()
+        mock_client = Mock(spec=TestRailClient)
+
+        def _tests(run_id):
+            threads.add(threading.current_thread())
+            return [{"id": run_id, "status_id": 1}]
+
+        mock_client.get_tests_for_run.side_effect = _tests
+
+        for _ in range(3):
+            calculate_run_statistics_bulk(list(range(1, 9)), mock_client)
+
+        self.assertLessEqual(len(threads), RUN_STATS_MAX_WORKERS)
+        self.assertTrue(all(t.name.startswith("run-stats") and t.is_alive() for t in threads))
+
+    def test_bulk_with_no_runs(self):
+        self.assertEqual(calculate_run_statistics_bulk([], Mock(spec=TestRailClient)), {})
+
+
 if __name__ == "__main__":
     unittest.main()
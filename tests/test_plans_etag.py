@@ -0,0 +1,135 @@
+"""Tests for conditional (ETag) responses on /api/plans and /api/runs."""
+
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import TestRailCredentials, get_plans_cache, get_runs_cache
+from app.main import app
+from app.services.cache import TTLCache
+
+PLANS = [{"id": 1, "name": "Plan A", "is_completed": False, "created_on": 1700000000}]
+PLAN = {"id": 1, "entries": [{"name": "Suite A", "runs": [{"id": 11, "name": "Run 11", "is_completed": False}]}]}
+
+
+class TestPlansETag(unittest.TestCase):
+    def setUp(self):
+        self.cache = TTLCache(ttl_seconds=60, maxsize=8)
+        app.dependency_overrides[get_plans_cache] = lambda: self.cache
+        credentials = TestRailCredentials("https://test.testrail.io", "user", "key")
+        self.patches = [
+            patch("app.api.general.dependencies.get_testrail_credentials", return_value=credentials),
+            patch("app.api.general.get_plans_for_project", return_value=PLANS),
+        ]
+        self.mock_get_plans = [p.start() for p in self.patches][1]
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        app.dependency_overrides.clear()
+
+    def test_response_carries_weak_etag(self):
+        response = self.client.get("/api/plans?project=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["ETag"].startswith('W/"'))
+        self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
+        self.assertNotIn("_etag", response.json())
+
+    def test_cache_hit_splices_meta_onto_serialized_payload(self):
+        self.client.get("/api/plans?project=1")
+
+        response = self.client.get("/api/plans?project=1")
+
+        self.assertEqual(response.headers["content-type"], "application/json")
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["plans"], PLANS)
+        self.assertTrue(data["meta"]["cache"]["hit"])
+        self.mock_get_plans.assert_called_once()
+
+    def test_matching_if_none_match_returns_304_from_cache(self):
+        etag = self.client.get("/api/plans?project=1").headers["ETag"]
+
+        response = self.client.get("/api/plans?project=1", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+        self.mock_get_plans.assert_called_once()
+
+    def test_changed_plans_produce_new_etag(self):
+        first = self.client.get("/api/plans?project=1").headers["ETag"]
+        self.cache.clear()
+        self.mock_get_plans.return_value = [{**PLANS[0], "is_completed": True}]
+
+        response = self.client.get("/api/plans?project=1", headers={"If-None-Match": first})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], first)
+
+    def test_plans_missing_fields_are_slimmed_with_none(self):
+        self.mock_get_plans.return_value = [{"id": 2, "name": "Partial", "description": "dropped"}]
+
+        plans = self.client.get("/api/plans?project=1").json()["plans"]
+
+        self.assertEqual(plans, [{"id": 2, "name": "Partial", "is_completed": None, "created_on": None}])
+
+
+class TestRunsETag(unittest.TestCase):
+    def setUp(self):
+        self.cache = TTLCache(ttl_seconds=60, maxsize=8)
+        app.dependency_overrides[get_runs_cache] = lambda: self.cache
+        credentials = TestRailCredentials("https://test.testrail.io", "user", "key")
+        self.patches = [
+            patch("app.api.general.dependencies.get_testrail_credentials", return_value=credentials),
+            patch("app.api.general.get_plan", return_value=PLAN),
+        ]
+        self.mock_get_plan = [p.start() for p in self.patches][1]
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        app.dependency_overrides.clear()
+
+    def test_matching_if_none_match_returns_304_from_cache(self):
+        first = self.client.get("/api/runs?plan=1")
+        etag = first.headers["ETag"]
+        self.assertNotIn("_etag", first.json())
+
+        response = self.client.get("/api/runs?plan=1", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.mock_get_plan.assert_called_once()
+
+    def test_stale_etag_gets_full_payload(self):
+        response = self.client.get("/api/runs?plan=1", headers={"If-None-Match": 'W/"stale"'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["runs"][0]["id"], 11)
+
+    def test_runs_are_flattened_and_sorted_open_first(self):
+        self.mock_get_plan.return_value = {
+            "entries": [
+                {"name": "Suite A", "runs": [{"id": 1, "name": "B", "is_completed": True}, {"name": "no id"}]},
+                {
+                    "name": "Suite B",
+                    "runs": [{"id": 2, "name": "Z", "is_completed": False}, {"id": 3}],
+                },
+            ]
+        }
+
+        runs = self.client.get("/api/runs?plan=2").json()["runs"]
+
+        self.assertEqual(
+            [(r["id"], r["name"], r["suite_name"]) for r in runs],
+            [(3, "Run 3", "Suite B"), (2, "Z", "Suite B"), (1, "B", "Suite A")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,15 @@
 """Property-based tests for cache efficiency."""
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from app.services.cache import TTLCache, cache_meta
+from app.services.cache import REFRESH_RETRY_SECONDS, TTLCache, cache_meta
 
 
 class TestCacheEfficiency:
@@ -33,12 +37,9 @@ class TestCacheEfficiency:
         cached_value, cached_expires_at = result
         assert cached_expires_at == expires_at, "Expiration time should match"
 
-        # Value should match (accounting for dict copying)
-        if isinstance(value, dict):
-            assert cached_value == value, "Cached dict should match original"
-            assert cached_value is not value, "Cached dict should be a copy"
-        else:
-            assert cached_value == value, "Cached value should match original"
+        # Values are shared by reference; callers treat cached payloads as read-only
+        assert cached_value == value, "Cached value should match original"
+        assert cached_value is value, "Cached value should not be copied"
 
     @given(
         ttl_seconds=st.integers(min_value=1, max_value=10),
@@ -225,3 +226,168 @@ class TestCacheEfficiency:
                 assert success, f"Cache operation failed for key: {key}"
             else:
                 assert success, "Size check failed"
+
+    @given(maxsize=st.integers(min_value=2, max_value=20))
+    def test_recently_read_entries_survive_eviction(self, maxsize):
+        """A read gives an entry a second chance, so eviction skips it for an unread key."""
+        cache = TTLCache(ttl_seconds=60, maxsize=maxsize)
+        for i in range(maxsize):
+            cache.set(("k", i), i)
+
+        assert cache.get(("k", 0)) is not None
+        cache.set(("k", maxsize), maxsize)
+
+        assert cache.size() == maxsize
+        assert cache.get(("k", 0)) is not None
+        assert cache.get(("k", 1)) is None
+
+    def test_eviction_when_every_entry_was_read(self):
+        """With all reference bits set, one CLOCK pass clears them and evicts the oldest entry."""
+        cache = TTLCache(ttl_seconds=60, maxsize=3)
+        for i in range(3):
+            cache.set(("k", i), i)
+            cache.get(("k", i))
+
+        cache.set(("k", 3), 3)
+
+        assert cache.size() == 3
+        assert cache.get(("k", 0)) is None
+        assert all(cache.get(("k", i)) is not None for i in (1, 2, 3))
+
+    def test_stale_reference_bit_gives_no_second_chance(self):
+        """A bit left behind for an evicted key is cleared when that key is inserted again."""
+        cache = TTLCache(ttl_seconds=60, maxsize=2)
+        cache.set(("k", 0), 0)
+        cache.set(("k", 1), 1)
+        cache.set(("k", 2), 2)  # evicts ("k", 0)
+        # As if a get() raced with that eviction and marked ("k", 0) after it was dropped.
+        cache._referenced.add(("k", 0))
+        cache.set(("k", 0), 0)  # evicts ("k", 1)
+        cache.get(("k", 2))
+
+        cache.set(("k", 3), 3)
+
+        assert cache.get(("k", 0)) is None
+        assert cache.get(("k", 2)) is not None
+
+    def test_cache_hit_does_not_wait_for_writer_lock(self):
+        """A live entry is readable while another thread holds the cache lock."""
+        cache = TTLCache(ttl_seconds=60, maxsize=4)
+        cache.set(("plans", 1), {"count": 1})
+
+        with cache._lock:
+            result = cache.get(("plans", 1))
+
+        assert result is not None
+        assert result[0] == {"count": 1}
+
+    def test_concurrent_misses_share_one_load(self):
+        """get_or_compute runs the loader once for a burst of concurrent misses on the same key."""
+        cache = TTLCache(ttl_seconds=60, maxsize=4)
+        calls = []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            release.wait(2)
+            return {"count": 1}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.get_or_compute, ("plans", 1), loader) for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(value == {"count": 1} for value, _ in results)
+
+    def test_failed_load_is_not_cached(self):
+        """A loader exception propagates and the next call retries the load."""
+        cache = TTLCache(ttl_seconds=60, maxsize=4)
+
+        def failing():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute(("runs", 1), failing)
+
+        value, _ = cache.get_or_compute(("runs", 1), lambda: {"count": 0})
+        assert value == {"count": 0}
+
+    def test_refresh_ahead_reloads_aging_entry_in_background(self):
+        """Past the refresh point a hit keeps serving the old value while a reload runs."""
+        cache = TTLCache(ttl_seconds=1, maxsize=4)
+        cache.set(("plans", 1), {"version": 1})
+        assert cache.refresh_ahead(("plans", 1), lambda: {"version": 2}) is False
+
+        time.sleep(0.85)
+        loaded = threading.Event()
+
+        def loader():
+            loaded.set()
+            return {"version": 2}
+
+        assert cache.refresh_ahead(("plans", 1), loader) is True
+        assert loaded.wait(2)
+        deadline = time.time() + 2
+        while (cache.get(("plans", 1)) or (None,))[0] != {"version": 2} and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get(("plans", 1))[0] == {"version": 2}
+
+    def test_failed_refresh_is_not_retried_on_every_hit(self):
+        """A failing background reload waits REFRESH_RETRY_SECONDS before the next attempt."""
+        cache = TTLCache(ttl_seconds=60, maxsize=4)
+        cache.set(("plans", 1), {"version": 1})
+        calls = []
+        failed = threading.Event()
+
+        def failing():
+            calls.append(1)
+            failed.set()
+            raise RuntimeError("upstream down")
+
+        past_refresh = time.monotonic() + 50
+        with patch("app.services.cache.time.monotonic", return_value=past_refresh):
+            assert cache.refresh_ahead(("plans", 1), failing) is True
+            assert failed.wait(2)
+            deadline = time.time() + 2
+            while ("plans", 1) in cache._inflight and time.time() < deadline:
+                time.sleep(0.01)
+            results = [cache.refresh_ahead(("plans", 1), failing) for _ in range(50)]
+
+        assert results == [False] * 50
+        assert len(calls) == 1
+        assert cache.get(("plans", 1))[0] == {"version": 1}
+
+        with patch("app.services.cache.time.monotonic", return_value=past_refresh + REFRESH_RETRY_SECONDS + 1):
+            assert cache.refresh_ahead(("plans", 1), lambda: {"version": 2}) is True
+
+    def test_wall_clock_jump_does_not_expire_entries(self):
+        """TTLs run on the monotonic clock, so an NTP step forward keeps live entries live."""
+        cache = TTLCache(ttl_seconds=60, maxsize=4)
+        expires_at = cache.set(("plans", 1), {"plans": []})
+        with patch("app.services.cache.time.time", return_value=time.time() + 3600):
+            assert cache.get(("plans", 1)) == ({"plans": []}, expires_at)
+
+    def test_expired_entries_are_swept_on_set(self):
+        """Entries nobody reads again are purged by later writes instead of lingering until evicted."""
+        cache = TTLCache(ttl_seconds=60, maxsize=16)
+        cache.set(("plans", 1), "cold", ttl_seconds=1)
+        cache.set(("plans", 2), "refreshed", ttl_seconds=1)
+        cache.set(("plans", 2), "refreshed", ttl_seconds=120)
+        later = time.monotonic() + 5
+        with patch("app.services.cache.time.monotonic", return_value=later):
+            cache.set(("plans", 3), "new")
+        assert cache.size() == 2
+        assert cache.get(("plans", 2))[0] == "refreshed"
+
+    def test_set_many_matches_individual_sets(self):
+        """Bulk inserts share one TTL and still respect maxsize."""
+        cache = TTLCache(ttl_seconds=60, maxsize=3)
+
+        assert cache.set_many((("k", i), i) for i in range(5)) == 5
+
+        assert cache.size() == 3
+        assert [cache.get(("k", i)) for i in range(2)] == [None, None]
+        expiries = {cache.get(("k", i))[1] for i in range(2, 5)}
+        assert len(expiries) == 1
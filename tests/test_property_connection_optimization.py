@@ -87,6 +87,31 @@ class TestConnectionOptimization:
                 assert result["endpoint"] == f"/test_endpoint_{i}"
                 assert result["params"] == {"id": i}
 
+    def test_batch_requests_overlap_and_keep_request_order(self):
+        """Batched requests run concurrently, yet results line up with the input order."""
+        service = TestRailClientService()
+        service._client = Mock()
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(endpoint, params=None):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            # Earlier requests take longer so completion order is the reverse of submission.
+            time.sleep(0.05 * (4 - params["id"]))
+            with lock:
+                in_flight -= 1
+            return params["id"]
+
+        service._client.get = slow_get
+        requests_data = [{"method": "GET", "endpoint": "/x", "params": {"id": i}} for i in range(4)]
+
+        assert service.batch_requests(requests_data) == [0, 1, 2, 3]
+        assert peak > 1
+
     def test_connection_pool_configuration_optimizes_performance(self):
         """Test that connection pool is configured for optimal performance."""
         service = TestRailClientService()
@@ -6,7 +6,14 @@ import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
 
-from app.core.dependencies import get_plans_cache, get_runs_cache, get_testrail_client, require_write_enabled
+from app.core.dependencies import (
+    get_plans_cache,
+    get_runs_cache,
+    get_testrail_client,
+    get_testrail_credentials,
+    get_testrail_session,
+    require_write_enabled,
+)
 
 
 class TestDependencyInjectionUsage:
@@ -177,3 +184,64 @@ class TestDependencyInjectionUsage:
             data = response.json()
             assert "detail" in data
             assert "credentials" in data["detail"].lower()
+
+    def test_testrail_client_reused_per_credential_set(self):
+        """Test that the same credentials share one client while rotated credentials get a new one."""
+        env = {
+            "TESTRAIL_BASE_URL": "https://test.testrail.io",
+            "TESTRAIL_USER": "test@example.com",
+            "TESTRAIL_API_KEY": "test-key",
+        }
+        with patch.dict("os.environ", env):
+            first = get_testrail_client()
+            second = get_testrail_client()
+        with patch.dict("os.environ", {**env, "TESTRAIL_API_KEY": "rotated-key"}):
+            cached = get_testrail_client()
+            get_testrail_credentials.cache_clear()
+            rotated = get_testrail_client()
+
+        assert first is second is cached
+        assert rotated is not first
+        assert rotated.auth == ("test@example.com", "rotated-key")
+
+    def test_testrail_credentials_resolved_once(self):
+        """Test that TestRail credentials are read from the environment once and reused everywhere."""
+        env = {
+            "TESTRAIL_BASE_URL": "https://test.testrail.io/",
+            "TESTRAIL_USER": "test@example.com",
+            "TESTRAIL_API_KEY": "test-key",
+        }
+        with patch.dict("os.environ", env):
+            first = get_testrail_credentials()
+        with patch.dict("os.environ", {}, clear=True):
+            second = get_testrail_credentials()
+            client = get_testrail_client()
+
+        assert first is second
+        assert first.base_url == "https://test.testrail.io"
+        assert first.auth == ("test@example.com", "test-key")
+        assert client.auth == first.auth
+
+    def test_testrail_session_reused_across_calls(self):
+        """Test that endpoints on the same thread share one authenticated keep-alive session."""
+        env = {
+            "TESTRAIL_BASE_URL": "https://test.testrail.io",
+            "TESTRAIL_USER": "test@example.com",
+            "TESTRAIL_API_KEY": "test-key",
+        }
+        with patch.dict("os.environ", env):
+            first = get_testrail_session()
+            second = get_testrail_session()
+
+        assert first is second
+        assert first.auth == ("test@example.com", "test-key")
+
+    def test_missing_testrail_credentials_are_not_cached(self):
+        """Test that a missing credential keeps failing until it is configured."""
+        from fastapi import HTTPException
+
+        with patch.dict("os.environ", {}, clear=True):
+            with pytest.raises(HTTPException) as exc_info:
+                get_testrail_credentials()
+        assert exc_info.value.status_code == 500
+        assert get_testrail_credentials.cache_info().currsize == 0
@@ -1,14 +1,17 @@
 """Property-based tests for memory efficiency."""
 
+import asyncio
 import gc
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from app.services.cache import TTLCache
+from app.services.performance import PerformanceService
 
 
 class TestMemoryEfficiency:
@@ -218,6 +221,54 @@ class TestMemoryEfficiency:
             final_memory_growth < reasonable_chunk_memory / 2
         ), f"Final memory growth {final_memory_growth} should be minimal"
 
+    def test_stream_large_dataset_pulls_generator_lazily(self):
+        """Streaming consumes the source one chunk (plus lookahead) at a time, not all up front."""
+        produced = []
+
+        def source(n):
+            for i in range(n):
+                produced.append(i)
+                yield i
+
+        async def first_chunk():
+            stream = PerformanceService().stream_large_dataset(source, chunk_size=10, n=1000)
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        chunk = asyncio.run(first_chunk())
+
+        assert chunk["data"] == list(range(10))
+        assert chunk["has_more"] is True
+        assert len(produced) == 20
+
+    def test_stream_executor_size_only_grows_from_config(self):
+        """The streaming pool keeps at least 4 threads and PERF_IO_WORKERS can only raise it."""
+        cases = [(1, 0, 4), (1, 1, 4), (3, 16, 16)]
+        for report_workers, io_workers, expected in cases:
+            with patch("app.services.performance.config.REPORT_WORKERS", report_workers), patch(
+                "app.services.performance.config.PERF_IO_WORKERS", io_workers
+            ):
+                service = PerformanceService()
+            assert service._executor._max_workers == expected
+            service._executor.shutdown()
+
+    def test_memory_monitor_skips_gc_by_default_and_is_noop_without_psutil(self):
+        """memory_monitor never forces a collection unless asked, and measures nothing without psutil."""
+
+        async def enter_monitor():
+            async with PerformanceService().memory_monitor(threshold_mb=5) as info:
+                return info
+
+        with patch("app.services.performance.gc.collect") as mock_collect:
+            asyncio.run(enter_monitor())
+            mock_collect.assert_not_called()
+
+            with patch("app.services.performance.PSUTIL_AVAILABLE", False):
+                info = asyncio.run(enter_monitor())
+
+        assert info == {"start_memory_mb": 0, "threshold_mb": 5}
+
     def test_cache_eviction_frees_memory(self):
         """Test that cache eviction actually frees memory."""
         cache = TTLCache(ttl_seconds=1, maxsize=5)  # Short TTL for testing
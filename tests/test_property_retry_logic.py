@@ -1,5 +1,6 @@
 """Property-based tests for retry logic implementation."""
 
+import asyncio
 import time
 from unittest.mock import Mock, patch
 
@@ -263,3 +264,27 @@ class TestRetryLogicImplementation:
             unique_delays = set(round(delay, 2) for delay in retry_delays)
             # Should have some variation due to jitter (allow for some identical values)
             assert len(unique_delays) >= len(retry_delays) * 0.6, "Retry delays should include jitter for variation"
+
+    def test_async_retry_awaits_backoff_without_blocking(self):
+        """The async variant retries transient errors and awaits its backoff instead of sleeping."""
+        service = TestRailClientService()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise requests.exceptions.ConnectionError("Simulated reset")
+            return "success"
+
+        async def no_wait(delay):
+            delays.append(delay)
+
+        delays = []
+        with patch("app.services.testrail_client.asyncio.sleep", side_effect=no_wait), patch(
+            "time.sleep", side_effect=AssertionError("blocking sleep")
+        ):
+            result = asyncio.run(service.with_retry_async(flaky))
+
+        assert result == "success"
+        assert len(attempts) == 3
+        assert 0.5 <= delays[0] <= 1.0 < delays[1] <= 2.0
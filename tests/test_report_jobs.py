@@ -0,0 +1,91 @@
+"""Tests for the async report job manager."""
+
+import threading
+import time
+import unittest
+import uuid
+from unittest.mock import patch
+
+from app.api.reports import ReportJobManager
+from app.core.dependencies import get_report_artifact_cache
+
+
+class TestReportJobQueue(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+        def fake_generate(**kwargs):
+            self.started.set()
+            self.release.wait(5)
+            return "/tmp/report.html"
+
+        get_report_artifact_cache().clear()
+        self.patches = [patch("app.api.reports.generate_report", side_effect=fake_generate)]
+        for p in self.patches:
+            p.start()
+        self.manager = ReportJobManager(max_workers=1, max_history=10)
+
+    def tearDown(self):
+        self.release.set()
+        self.manager.executor.shutdown(wait=True)
+        for p in self.patches:
+            p.stop()
+        get_report_artifact_cache().clear()
+
+    def test_queue_position_counts_jobs_ahead(self):
+        running = self.manager.enqueue({"project": 1, "plan": 1})
+        self.assertTrue(self.started.wait(2))
+        second = self.manager.enqueue({"project": 1, "plan": 2})
+        third = self.manager.enqueue({"project": 1, "plan": 3})
+
+        self.assertIsNone(self.manager.queue_position(running.id))
+        self.assertEqual(self.manager.queue_position(second.id), 0)
+        self.assertEqual(self.manager.queue_position(third.id), 1)
+        self.assertIsNone(self.manager.queue_position("missing"))
+
+        self.release.set()
+        deadline = time.time() + 5
+        while third.status != "success" and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(third.status, "success")
+        self.assertIsNone(self.manager.queue_position(third.id))
+        # finished jobs never change, so their serialized form is built once
+        self.assertIs(third.to_dict(), third.to_dict())
+        self.assertEqual(self.manager.serialize(third)["url"], "/reports/report.html")
+
+    def test_progress_updates_are_kept_per_job(self):
+        job = self.manager.enqueue({"project": 1, "plan": 1})
+        self.assertTrue(self.started.wait(2))
+
+        for i in range(30):
+            self.manager.report_progress(job.id, "stage", {"i": i})
+
+        meta = job.to_dict()["meta"]
+        self.assertEqual(meta["stage_payload"], {"i": 29})
+        self.assertEqual([u["payload"]["i"] for u in meta["progress_updates"]], list(range(5, 30)))
+
+    def test_finished_jobs_beyond_history_limit_are_dropped(self):
+        self.manager.max_history = 2
+        self.release.set()
+        jobs = [self.manager.enqueue({"project": 1, "plan": i}) for i in range(1, 5)]
+
+        deadline = time.time() + 5
+        while (jobs[-1].status != "success" or len(self.manager.order) > 2) and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(list(self.manager.order), [jobs[2].id, jobs[3].id])
+        self.assertIsNone(self.manager.get(jobs[0].id))
+
+    def test_job_ids_are_random_not_sequential(self):
+        self.release.set()
+        first = self.manager.enqueue({"project": 1, "plan": 1})
+        second = self.manager.enqueue({"project": 1, "plan": 2})
+
+        for job in (first, second):
+            self.assertEqual(uuid.UUID(hex=job.id).version, 4)
+        self.assertNotEqual(first.id[:-1], second.id[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""Tests for reusing freshly generated report artifacts."""
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.api.reports import ReportJobManager, generate_report_cached
+from app.core.dependencies import get_report_artifact_cache, get_testrail_client
+
+
+class TestReportArtifactReuse(unittest.TestCase):
+    def setUp(self):
+        get_report_artifact_cache().clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.report_path = str(Path(self.tmpdir.name) / "report.html")
+        Path(self.report_path).write_text("<html></html>", encoding="utf-8")
+
+    def tearDown(self):
+        get_report_artifact_cache().clear()
+        self.tmpdir.cleanup()
+
+    def test_identical_request_reuses_existing_artifact(self):
+        with patch("app.api.reports.generate_report", return_value=self.report_path) as mock_generate:
+            first = generate_report_cached(project=1, plan=10, run_ids=[2, 1])
+            second = generate_report_cached(project=1, plan=10, run_ids=[2, 1])
+
+        self.assertEqual(first, self.report_path)
+        self.assertEqual(second, self.report_path)
+        mock_generate.assert_called_once_with(project=1, plan=10, run=None, run_ids=[2, 1])
+
+    def test_reordered_run_ids_generate_again(self):
+        with patch("app.api.reports.generate_report", return_value=self.report_path) as mock_generate:
+            generate_report_cached(project=1, plan=10, run_ids=[3, 1])
+            generate_report_cached(project=1, plan=10, run_ids=[1, 3])
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_different_parameters_generate_again(self):
+        with patch("app.api.reports.generate_report", return_value=self.report_path) as mock_generate:
+            generate_report_cached(project=1, plan=10)
+            generate_report_cached(project=1, plan=11)
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_deleted_artifact_is_regenerated(self):
+        with patch("app.api.reports.generate_report", return_value=self.report_path) as mock_generate:
+            generate_report_cached(project=1, run=5)
+            Path(self.report_path).unlink()
+            generate_report_cached(project=1, run=5)
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_reuse_disabled_when_ttl_is_zero(self):
+        with patch("app.api.reports.config.REPORT_REUSE_TTL", 0), patch(
+            "app.api.reports.generate_report", return_value=self.report_path
+        ) as mock_generate:
+            generate_report_cached(project=1, run=5)
+            generate_report_cached(project=1, run=5)
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    def test_identical_queued_job_reuses_finished_artifact(self):
+        manager = ReportJobManager(max_workers=1, max_history=10)
+        params = {"project": 1, "plan": 10, "run": None, "run_ids": None}
+        with patch("app.api.reports.generate_report", return_value=self.report_path) as mock_generate:
+            first = manager.enqueue(dict(params))
+            second = manager.enqueue(dict(params))
+            deadline = time.time() + 5
+            while second.status != "success" and time.time() < deadline:
+                time.sleep(0.01)
+        manager.executor.shutdown(wait=True)
+
+        self.assertEqual(second.status, "success")
+        self.assertEqual(second.path, self.report_path)
+        self.assertFalse(first.meta["reused"])
+        self.assertTrue(second.meta["reused"])
+        mock_generate.assert_called_once()
+
+    def test_identical_jobs_running_together_generate_once(self):
+        manager = ReportJobManager(max_workers=2, max_history=10)
+        params = {"project": 1, "plan": 10, "run": None, "run_ids": None}
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_generate(**kwargs):
+            started.set()
+            release.wait(5)
+            return self.report_path
+
+        with patch("app.api.reports.generate_report", side_effect=slow_generate) as mock_generate:
+            first = manager.enqueue(dict(params))
+            second = manager.enqueue(dict(params))
+            self.assertTrue(started.wait(2))
+            deadline = time.time() + 2
+            while second.status != "running" and time.time() < deadline:
+                time.sleep(0.01)
+            release.set()
+            manager.executor.shutdown(wait=True)
+
+        self.assertEqual([first.status, second.status], ["success", "success"])
+        self.assertEqual(second.path, self.report_path)
+        self.assertEqual(sorted([first.meta["reused"], second.meta["reused"]]), [False, True])
+        mock_generate.assert_called_once()
+
+
+class TestReportParamsRejectedBeforeGeneration(unittest.TestCase):
+    def setUp(self):
+        from app.main import app
+
+        self.app = app
+        app.dependency_overrides[get_testrail_client] = lambda: None
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.app.dependency_overrides.clear()
+
+    def test_invalid_form_values_never_reach_generate_report(self):
+        cases = [
+            {"plan": "abc"},
+            {"plan": "0"},
+            {"plan": "1", "run": "2"},
+            {"run": "3", "run_ids": ["4"]},
+            {"plan": "1", "run_ids": ["-1"]},
+        ]
+        with patch("app.api.reports.generate_report") as mock_generate:
+            for form in cases:
+                with self.subTest(form=form):
+                    response = self.client.post("/generate", data=form, follow_redirects=False)
+                    self.assertEqual(response.status_code, 400)
+        mock_generate.assert_not_called()
+
+    def test_non_positive_ids_rejected_on_sync_endpoint(self):
+        with patch("app.api.reports.generate_report") as mock_generate:
+            response = self.client.get("/api/report?project=1&run=0")
+
+        self.assertEqual(response.status_code, 400)
+        mock_generate.assert_not_called()
+
+
+class TestGeneratedReportServing(unittest.TestCase):
+    def setUp(self):
+        from app.main import REPORTS_DIR, app
+
+        self.client = TestClient(app)
+        self.report = REPORTS_DIR / "_serving_test_report.html"
+        self.report.write_text("<html>report</html>", encoding="utf-8")
+
+    def tearDown(self):
+        self.report.unlink(missing_ok=True)
+
+    def test_report_is_served_for_revalidation(self):
+        response = self.client.get(f"/reports/{self.report.name}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "<html>report</html>")
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        self.assertIn("last-modified", response.headers)
+        self.assertTrue(response.headers["Content-Type"].startswith("text/html"))
+
+    def test_unchanged_report_revalidates_with_304(self):
+        etag = self.client.get(f"/reports/{self.report.name}").headers["ETag"]
+
+        response = self.client.get(f"/reports/{self.report.name}", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+        self.report.write_text("<html>regenerated report</html>", encoding="utf-8")
+        response = self.client.get(f"/reports/{self.report.name}", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_missing_or_traversing_names_are_not_found(self):
+        for path in ("/reports/missing.html", "/reports/%2e%2e%2frequirements.txt", "/reports/.hidden"):
+            self.assertEqual(self.client.get(path).status_code, 404, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -402,3 +402,56 @@ def test_delete_case_with_api_error(monkeypatch):
         assert False, "Expected HTTPError"
     except requests.exceptions.HTTPError:
         pass
+
+
+def test_pooled_session_is_reused_per_thread():
+    """Calls on one thread share a keep-alive session; other threads get their own."""
+    import threading
+
+    client = TestRailClient(base_url="http://test.testrail.io", auth=("user", "pass"))
+
+    with client.pooled_session() as first:
+        pass
+    with client.pooled_session() as second:
+        pass
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(client.pooled_session().__enter__()))
+    thread.start()
+    thread.join()
+
+    assert first is second
+    assert first.auth == ("user", "pass")
+    assert other[0] is not first
+
+
+def test_api_get_honors_retry_after_on_429(monkeypatch):
+    """A 429 Retry-After longer than the local backoff sets the wait before retrying."""
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    class FakeResponse:
+        def __init__(self, status_code, payload=None, headers=None):
+            self.status_code = status_code
+            self._payload = payload or {}
+            self.headers = headers or {}
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(response=self)
+
+        def json(self):
+            return self._payload
+
+    class FakeSession:
+        def __init__(self, responses):
+            self._responses = iter(responses)
+
+        def get(self, url, timeout=None):
+            return next(self._responses)
+
+    session = FakeSession([FakeResponse(429, headers={"Retry-After": "7"}), FakeResponse(200, {"ok": True})])
+
+    assert api_get(session, "http://x", "get_stuff", max_attempts=2, backoff=1.0) == {"ok": True}
+    assert len(sleeps) == 1
+    assert 7.0 <= sleeps[0] <= 7.1
@@ -0,0 +1,50 @@
+"""Tests for the typed TestRail payload views."""
+
+import unittest
+
+from pydantic import ValidationError
+
+from app.models.testrail import PlanPayload
+
+
+class TestPlanPayload(unittest.TestCase):
+    def test_runs_are_flattened_with_their_entry(self):
+        plan = PlanPayload.model_validate(
+            {
+                "id": 7,
+                "entries": [
+                    {"name": "Suite A", "runs": [{"id": 1, "name": "Run 1"}, {"id": "2"}]},
+                    {"name": "Suite B", "runs": [{"id": 3, "suite_name": "Override"}]},
+                ],
+            }
+        )
+
+        pairs = [(entry.name, run.id) for entry, run in plan.runs()]
+
+        self.assertEqual(pairs, [("Suite A", 1), ("Suite A", 2), ("Suite B", 3)])
+
+    def test_malformed_entries_and_runs_are_skipped(self):
+        plan = PlanPayload.model_validate(
+            {
+                "entries": [
+                    "not an entry",
+                    {"runs": "not a list"},
+                    {"runs": [None, {"id": None}, {"id": "abc"}, {"id": 0}, {"id": 5}]},
+                ]
+            }
+        )
+
+        self.assertEqual([run.id for _, run in plan.runs()], [5])
+        self.assertEqual(plan.run_ids(), [5])
+
+    def test_missing_or_invalid_entries_yield_no_runs(self):
+        self.assertEqual(list(PlanPayload.model_validate({}).runs()), [])
+        self.assertEqual(list(PlanPayload.model_validate({"entries": {"a": 1}}).runs()), [])
+
+    def test_non_mapping_payload_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            PlanPayload.model_validate(["not", "a", "plan"])
+
+
+if __name__ == "__main__":
+    unittest.main()
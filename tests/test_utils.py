@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
@@ -7,6 +10,10 @@ from testrail_client import (
     get_plans_for_project,
 )
 from testrail_daily_report import (
+    DATA_URL_CHUNK_BYTES,
+    _build_data_url,
+    _build_data_url_from_file,
+    _guess_attachment_type,
     build_test_table,
     extract_refs,
     summarize_results,
@@ -123,5 +130,38 @@ class TestExtractRefs(unittest.TestCase):
         self.assertEqual(refs, ["ABC-1", "ABC-2", "ABC-3"])
 
 
+class TestBuildDataUrlFromFile(unittest.TestCase):
+    def test_chunked_encoding_matches_in_memory_encoding(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for size in (1, DATA_URL_CHUNK_BYTES, DATA_URL_CHUNK_BYTES + 1, 2 * DATA_URL_CHUNK_BYTES + 2):
+                with self.subTest(size=size):
+                    payload = os.urandom(size)
+                    path = Path(tmpdir) / f"clip_{size}.mp4"
+                    path.write_bytes(payload)
+                    self.assertEqual(
+                        _build_data_url_from_file(path, "video/mp4"),
+                        _build_data_url(payload, "video/mp4"),
+                    )
+
+    def test_empty_or_missing_file_has_no_data_url(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            empty = Path(tmpdir) / "empty.mp4"
+            empty.write_bytes(b"")
+            self.assertIsNone(_build_data_url_from_file(empty, "video/mp4"))
+            self.assertIsNone(_build_data_url_from_file(Path(tmpdir) / "missing.mp4", "video/mp4"))
+
+
+class TestGuessAttachmentType(unittest.TestCase):
+    def test_common_extensions_use_lookup_table(self):
+        with patch("testrail_daily_report.mimetypes.guess_type") as guess:
+            self.assertEqual(_guess_attachment_type("Screen Shot.PNG"), "image/png")
+            self.assertEqual(_guess_attachment_type("clip.mov"), "video/quicktime")
+        guess.assert_not_called()
+
+    def test_uncommon_extensions_fall_back_to_mimetypes(self):
+        self.assertEqual(_guess_attachment_type("data.csv"), "text/csv")
+        self.assertIsNone(_guess_attachment_type("no_extension"))
+
+
 if __name__ == "__main__":
     unittest.main()